@@ -11,6 +11,10 @@ from typing import Dict, Any
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from dotenv import load_dotenv
+
+# Load environment variables before the agent modules read them at import
+load_dotenv()
+
 from fastapi import FastAPI, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -30,9 +34,6 @@ from agent_v5 import create_agent_graph, create_agent_with_opik
 # Import Supabase authentication utilities
 from auth_utils import get_user_context_for_copilotkit
 
-# Load environment variables
-load_dotenv()
-
 print(f"✓ Using Agent V5 with PostgreSQL persistence")
 
 warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
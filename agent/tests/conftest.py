@@ -0,0 +1,16 @@
+"""Make the agent modules importable the way the server imports them."""
+
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# utils.prompts fetches every prompt from Opik at import time; give the tests
+# placeholder prompts so importing the tools needs neither Opik nor a network.
+_prompts = types.ModuleType("utils.prompts")
+_prompts.get_prompt = lambda name: f"{name} (test prompt)"
+_prompts.SYSTEM_PROMPT = _prompts.get_prompt("AuraChef system")
+_prompts.VALIDATE_AND_FORMAT_PROMPT = _prompts.get_prompt("AuraChef validate and format")
+_prompts.EXTRACT_RECIPE_NAME_PROMPT = _prompts.get_prompt("AuraChef extract recipe name")
+sys.modules.setdefault("utils.prompts", _prompts)
@@ -0,0 +1,47 @@
+"""Streaming HTML text extraction must keep entities and accents intact."""
+
+import pytest
+
+unified_extraction = pytest.importorskip("tools.unified_extraction")
+
+
+_PAGE = """<html><head><title>Caf&eacute; &amp; Co</title><style>p { color: red }</style></head>
+<body>
+<h1>Tom &amp; Jerry&#39;s Pie</h1><p>AT&amp;T caf&eacute;</p><div>R&eacute;sum&eacute;<br>next</div>
+<ul><li>2 cups flour</li><li>1&frac12; tsp salt</li></ul>
+<script>var x = "hidden";</script><noscript>Enable JavaScript</noscript>
+<table><tr><td>a</td><td>b</td></tr></table>
+</body></html>"""
+
+# What BeautifulSoup's get_text(separator=' ', strip=True) gives for _PAGE
+_EXPECTED_TEXT = "Café & Co Tom & Jerry's Pie AT&T café Résumé next 2 cups flour 1½ tsp salt a b"
+
+
+def test_extract_text_keeps_entities_and_accents():
+    assert unified_extraction.extract_text_from_html(_PAGE) == _EXPECTED_TEXT
+
+
+def test_block_elements_are_separated():
+    html = "<div>one</div><div>two</div><p>three<br>four</p><span>fi</span>ve"
+    assert unified_extraction.extract_text_from_html(html) == "one two three four five"
+
+
+def test_parse_html_matches_extract_text():
+    text, title, recipe = unified_extraction._parse_html(_PAGE)
+
+    assert text == unified_extraction.extract_text_from_html(_PAGE)
+    assert title == "Café & Co"
+    assert recipe is None
+
+
+def test_parse_html_title_and_json_ld():
+    html = """<html><head><title>
+      Cr&egrave;me  Br&ucirc;l&eacute;e
+    </title>
+    <script type="application/ld+json">{"@type": "Recipe", "name": "Crème Brûlée"}</script>
+    </head><body><p>Custard &amp; sugar</p></body></html>"""
+    text, title, recipe = unified_extraction._parse_html(html)
+
+    assert text == "Crème Brûlée Custard & sugar"
+    assert title == "Crème Brûlée"
+    assert recipe["name"] == "Crème Brûlée"
@@ -0,0 +1,108 @@
+"""Near-duplicate reuse of validation results: same recipe only, never a shared template."""
+
+import pytest
+
+from utils.cache import NearDuplicateIndex
+
+
+# Shared site template: long header/navigation that precedes every recipe
+_TEMPLATE = " ".join(
+    f"Home Recipes Breakfast Lunch Dinner Desserts About Contact Subscribe section{i}"
+    for i in range(40)
+)
+_BANANA_BREAD = (
+    "Banana Bread. Ingredients: 3 ripe bananas, 2 cups flour, 1 tsp baking soda, "
+    "1/2 cup sugar, 1 egg. Instructions: 1. Preheat the oven to 350F. 2. Mash the "
+    "bananas and mix in the sugar and egg. 3. Stir in the flour and bake 60 minutes."
+)
+_STEW = (
+    "Beef Stew. Ingredients: 2 pounds beef chuck, 4 cups stock, 3 carrots, 2 potatoes, "
+    "1 tbsp tomato paste. Instructions: 1. Brown the beef in batches. 2. Add the stock "
+    "and tomato paste and simmer 90 minutes. 3. Add the vegetables and simmer until tender."
+)
+
+
+def test_index_returns_most_similar_entry_above_threshold():
+    index = NearDuplicateIndex(maxsize=8, threshold=0.5)
+    index.add(frozenset({1, 2, 3, 4}), "banana")
+    index.add(frozenset({10, 11, 12, 13}), "stew")
+
+    assert index.get(frozenset({1, 2, 3, 5})) == "banana"
+    assert index.get(frozenset({20, 21, 22})) is None
+
+
+@pytest.fixture
+def unified_extraction():
+    module = pytest.importorskip("tools.unified_extraction")
+    module._validate_format_cache.clear()
+    module._near_duplicate_index.clear()
+    return module
+
+
+def _cache_banana_bread(unified_extraction, page, url):
+    result = unified_extraction.ValidateAndFormatOutput(
+        is_valid_recipe=True,
+        recipe_data=None,
+        recipe_name="Banana Bread",
+        has_ingredients=True,
+        has_instructions=True,
+        follow_up_url=None,
+        follow_up_confidence=0.0,
+        reason="cached for test",
+        confidence=0.9,
+    )
+    unified_extraction._store_validation(
+        unified_extraction._validate_format_cache_key(page, url),
+        unified_extraction._content_shingles(page),
+        url,
+        result,
+    )
+
+
+def _lookup(unified_extraction, page, url):
+    return unified_extraction._get_cached_validation(
+        unified_extraction._validate_format_cache_key(page, url),
+        unified_extraction._content_shingles(page),
+        url,
+        page,
+    )
+
+
+def test_recipes_sharing_a_template_do_not_share_results(unified_extraction):
+    banana_page = f"{_TEMPLATE} {_BANANA_BREAD}"
+    stew_page = f"{_TEMPLATE} {_STEW}"
+    _cache_banana_bread(unified_extraction, banana_page, "https://site.example/banana")
+
+    # Fingerprints come from the recipe body, not the shared header
+    banana_shingles = unified_extraction._content_shingles(banana_page)
+    stew_shingles = unified_extraction._content_shingles(stew_page)
+    shared = len(banana_shingles & stew_shingles)
+    similarity = shared / (len(banana_shingles) + len(stew_shingles) - shared)
+    assert similarity < unified_extraction.NEAR_DUPLICATE_THRESHOLD
+
+    assert _lookup(unified_extraction, stew_page, "https://site.example/stew") is None
+
+
+def test_refetch_of_the_same_page_reuses_the_result(unified_extraction):
+    banana_page = f"{_TEMPLATE} {_BANANA_BREAD}"
+    _cache_banana_bread(unified_extraction, banana_page, "https://site.example/banana")
+
+    cached = _lookup(unified_extraction, f"{banana_page} Updated today.", "https://site.example/banana/")
+    assert cached is not None
+    assert cached.recipe_name == "Banana Bread"
+
+
+def test_syndicated_recipe_reuses_the_result_on_another_url(unified_extraction):
+    _cache_banana_bread(unified_extraction, _BANANA_BREAD, "https://site.example/banana")
+
+    mirror_page = f"{_BANANA_BREAD} Reposted with permission."
+    cached = _lookup(unified_extraction, mirror_page, "https://mirror.example/recipes/banana-bread")
+    assert cached is not None
+    assert cached.recipe_name == "Banana Bread"
+
+
+def test_similar_page_without_the_recipe_name_is_not_reused(unified_extraction):
+    _cache_banana_bread(unified_extraction, _BANANA_BREAD, "https://site.example/banana")
+
+    renamed_page = _BANANA_BREAD.replace("Banana Bread.", "Plantain Loaf.")
+    assert _lookup(unified_extraction, renamed_page, "https://other.example/plantain-loaf") is None
@@ -6,7 +6,7 @@ from langgraph.prebuilt import InjectedState
 from langchain_core.messages import SystemMessage
 
 from .models import GeneratedRecipe, RecipeDataForLLM, RecipeJSON
-from utils.model import get_model
+from utils.model import get_model, structured_output_kwargs
 
 
 @tool
@@ -95,7 +95,9 @@ def generate_recipe_from_knowledge(
         model = get_model()
         
         # Use structured output to generate RecipeDataForLLM
-        structured_model = model.with_structured_output(RecipeDataForLLM)
+        structured_model = model.with_structured_output(
+            RecipeDataForLLM, **structured_output_kwargs()
+        )
         
         # Handle cases where recipe_name might be missing or generic
         # If we have partial content, let the AI infer a better name
@@ -259,7 +261,7 @@ Generate the recipe as structured JSON data matching the format above."""
             error=None,
             source="knowledge"
         )
-        return result.model_dump()
+        return result.model_dump(exclude_none=True)
         
     except Exception as e:
         # Fallback error
@@ -270,4 +272,4 @@ Generate the recipe as structured JSON data matching the format above."""
             error=f"Failed to generate recipe: {str(e)}",
             source="knowledge"
         )
-        return result.model_dump()
+        return result.model_dump(exclude_none=True)
@@ -6,8 +6,8 @@ agent nodes and tools. All tools in agent_v3 return instances of these models
 instead of plain dictionaries.
 """
 
-from typing import Optional, List, Literal, Union
-from pydantic import BaseModel, Field
+from typing import Optional, List, Literal, TypedDict, Union
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 import uuid
 
@@ -139,15 +139,19 @@ class RecipeIngredient(BaseModel):
         description="Unit of measurement (e.g., 'cups', 'g', 'cloves', 'pinch')"
     )
     
-    class Config:
-        extra = "forbid"  # Ensures additionalProperties: false
-        json_schema_extra = {
+    # Allocated 10-30 times per recipe: frozen instances are immutable and
+    # hashable.
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",  # Ensures additionalProperties: false
+        json_schema_extra={
             "example": {
                 "name": "All-purpose flour",
                 "quantity": 2.5,
                 "unit": "cups"
             }
-        }
+        },
+    )
 
 
 class RecipeJSON(BaseModel):
@@ -419,6 +423,56 @@ class ValidateAndFormatOutput(BaseModel):
         }
 
 
+class RecipeClassification(BaseModel):
+    """
+    Cheap recipe/not-recipe verdict from the small validation model.
+
+    Used internally by: extract_and_process_recipe (Agent V5)
+
+    Pages classified as recipes are then formatted by the main model; the
+    rest are answered from this verdict alone.
+    """
+    is_recipe: bool = Field(
+        description="True if content contains a complete recipe (ingredients with quantities and steps)"
+    )
+    has_ingredients: bool = Field(
+        description="Whether ingredients list with quantities exists"
+    )
+    has_instructions: bool = Field(
+        description="Whether step-by-step instructions exist"
+    )
+    recipe_name: Optional[str] = Field(
+        default=None,
+        description="Recipe name/title, if one is mentioned"
+    )
+    follow_up_url: Optional[str] = Field(
+        default=None,
+        description="URL in the content most likely to hold the full recipe (only if not a recipe)"
+    )
+    follow_up_confidence: float = Field(
+        ge=0.0,
+        le=1.0,
+        description="Confidence in follow-up URL (0.0-1.0)"
+    )
+    reason: str = Field(
+        description="Short explanation of the verdict"
+    )
+
+    class Config:
+        extra = "forbid"
+        json_schema_extra = {
+            "example": {
+                "is_recipe": False,
+                "has_ingredients": False,
+                "has_instructions": False,
+                "recipe_name": "Chocolate Chip Cookies",
+                "follow_up_url": "https://example.com/cookies",
+                "follow_up_confidence": 0.8,
+                "reason": "Caption names the dish and links to the full recipe"
+            }
+        }
+
+
 class UnifiedRecipeResult(BaseModel):
     """
     Final result from unified extraction tool.
@@ -510,3 +564,28 @@ class UnifiedRecipeResult(BaseModel):
                 "reason": "Complete recipe found with ingredients and instructions"
             }
         }
+
+
+class UnifiedRecipeResultDict(TypedDict):
+    """
+    Plain-dict form of UnifiedRecipeResult, as returned by the tool.
+
+    Returned by: extract_and_process_recipe (Agent V5)
+
+    Built directly on the hot path instead of validating a
+    UnifiedRecipeResult and dumping it; the fields are identical.
+    """
+    success: bool
+    recipe_json: Optional[dict]
+    recipe_name: Optional[str]
+    extraction_url: str
+    is_valid_recipe: bool
+    has_ingredients: bool
+    has_instructions: bool
+    follow_up_url: Optional[str]
+    extraction_depth: int
+    error: Optional[str]
+    confidence: float
+    reason: str
+    extracted_content: Optional[str]
+    partial_recipe_data: Optional[dict]
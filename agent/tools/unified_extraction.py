@@ -5,18 +5,63 @@ Combines extraction, validation, and formatting into a single operation
 with automatic follow-up link detection and recursive extraction.
 """
 
+import asyncio
+import contextlib
+import copy
+import hashlib
+import html as html_lib
+import json
+import logging
+import os
 import re
-from typing import Optional
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 from langchain_core.tools import tool
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import SystemMessage
+from langgraph.config import get_stream_writer
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
-from .models import UnifiedRecipeResult, ValidateAndFormatOutput
-from utils.retry import with_retry
-from utils.model import get_model
+# Optional faster JSON decoding for JSON-LD blocks
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Instagram fallback extractor; only needed when the HTML meta tags fail
+try:
+    import instaloader
+except ImportError:
+    instaloader = None
+
+# Optional tokenizer for budgeting LLM input by tokens (falls back to characters)
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+from .models import (
+    RecipeClassification,
+    RecipeDataForLLM,
+    RecipeJSON,
+    UnifiedRecipeResultDict,
+    ValidateAndFormatOutput,
+)
+from utils.retry import call_with_cancel_event, with_retry
+from utils.cache import NearDuplicateIndex, TTLCache
+from utils.http import RETRIABLE_HTTP_EXCEPTIONS, SESSION
+from utils.model import get_model, get_model_id, structured_output_kwargs, task_model_configured
 from utils.prompts import VALIDATE_AND_FORMAT_PROMPT
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # CONSTANTS
@@ -24,13 +69,154 @@ from utils.prompts import VALIDATE_AND_FORMAT_PROMPT
 
 MAX_DEPTH_LIMIT = 1  # Maximum number of follow-up links to pursue
 FOLLOW_UP_CONFIDENCE_THRESHOLD = 0.6  # Minimum confidence to follow a link
-CONTENT_TRUNCATE_LENGTH = 4000  # Characters to send to LLM
+CONTENT_TRUNCATE_LENGTH = 4000  # Characters to send to LLM (without tiktoken)
+CONTENT_TRUNCATE_TOKENS = 1000  # Tokens to send to LLM (with tiktoken)
+VALIDATE_FORMAT_CACHE_TTL = 86400  # Seconds to reuse an identical LLM result
+NEAR_DUPLICATE_PREFIX_LENGTH = 2000  # Characters of main content fingerprinted for near-duplicate lookup
+NEAR_DUPLICATE_THRESHOLD = 0.9  # Minimum shingle similarity to reuse a result
+FOLLOW_UP_MAX_CANDIDATES = 3  # Follow-up URLs fetched and validated together
+MIN_INGREDIENT_MARKERS = 3  # Quantity+unit matches needed to count as an ingredient list
+MIN_COOKING_VERB_MARKERS = 3  # Cooking verb matches needed to count as unnumbered instructions
+MAX_HTML_BYTES = 1024 * 1024  # Stop downloading a page after this many bytes
+HTML_CACHE_TTL = 300  # Seconds to keep fetched (or prefetched) page HTML
+RECIPE_RESULT_CACHE_TTL = 86400  # Seconds to reuse a successful tool result for a URL
+EXTRACTION_CACHE_TTL = 3600  # Seconds to reuse successfully extracted page content
+FAILED_EXTRACTION_CACHE_TTL = 300  # Seconds to remember a permanent extraction failure
+INSTAGRAM_HEDGE_DELAY = 2.0  # Seconds before instaloader races a slow HTML extraction
+INSTAGRAM_EXTRACTION_TIMEOUT = 30.0  # Seconds to wait for any Instagram method to succeed
+INSTAGRAM_REQUEST_TIMEOUT = 10.0  # Per-request timeout for instaloader (its default is 300s)
+# Concurrent page downloads allowed per host across the process (0 = unlimited)
+DOMAIN_CONCURRENCY_LIMIT = int(os.getenv('DOMAIN_CONCURRENCY_LIMIT', '8'))
+EXTRACTION_BATCH_WORKERS = 16  # Threads used by _extract_content_batch
+LLM_BATCH_MAX_CONCURRENCY = 4  # Concurrent requests per batched LLM dispatch
+
+# Exact-match cache of ValidateAndFormatOutput JSON, keyed by model/prompt/input
+_validate_format_cache = TTLCache(maxsize=256, ttl=VALIDATE_FORMAT_CACHE_TTL)
+# Near-duplicate content (syndicated recipes, reshares) -> ValidateAndFormatOutput JSON
+_near_duplicate_index = NearDuplicateIndex(maxsize=256, threshold=NEAR_DUPLICATE_THRESHOLD)
+# Canonical URL -> successful extract_and_process_recipe result
+_recipe_result_cache = TTLCache(maxsize=256, ttl=RECIPE_RESULT_CACHE_TTL)
+# Canonical URL (no trailing slash) -> successful SimpleExtractionResult
+_extraction_cache = TTLCache(maxsize=512, ttl=EXTRACTION_CACHE_TTL)
+# Same key -> failed SimpleExtractionResult (kept apart so failures never evict successes)
+_failed_extraction_cache = TTLCache(maxsize=1024, ttl=FAILED_EXTRACTION_CACHE_TTL)
+_PROMPT_VERSION = hashlib.sha256(VALIDATE_AND_FORMAT_PROMPT.encode()).hexdigest()[:12]
+
+# The validation instructions are rendered once with pointers to the user
+# message, so every call shares an identical system prefix that providers
+# can cache; only the user message below varies per page.
+VALIDATE_SYSTEM_PROMPT = VALIDATE_AND_FORMAT_PROMPT.format(
+    content="(provided in the user message under CONTENT)",
+    url="(provided in the user message under SOURCE URL)",
+    depth="(provided in the user message under DEPTH)",
+)
+VALIDATE_USER_TEMPLATE = "CONTENT:\n{content}\n\nSOURCE URL: {url}\nDEPTH: {depth}"
+
+# Compact prompt for the small model that gates the main validation call
+RECIPE_CLASSIFY_PROMPT = """You decide whether content from a web page or social media post contains a complete recipe.
+A complete recipe has an ingredient list with quantities AND step-by-step instructions.
+If it does not, pick the URL in the content most likely to lead to the full recipe (for example a recipe blog linked from a caption) and rate your confidence in it from 0.0 to 1.0; leave it empty if there is none.
+Name the dish if the content mentions one. Keep the reason to one sentence."""
+RECIPE_CLASSIFY_USER_TEMPLATE = "CONTENT:\n{content}\n\nSOURCE URL: {url}"
+
+# Prompt templates are immutable, so both are built once and only formatted per call
+_VALIDATE_PROMPT = ChatPromptTemplate.from_messages([
+    SystemMessage(content=VALIDATE_SYSTEM_PROMPT),
+    ("human", VALIDATE_USER_TEMPLATE),
+])
+_CLASSIFY_PROMPT = ChatPromptTemplate.from_messages([
+    SystemMessage(content=RECIPE_CLASSIFY_PROMPT),
+    ("human", RECIPE_CLASSIFY_USER_TEMPLATE),
+])
+
+# Words that cluster around the recipe body of a page
+_RECIPE_KEYWORD_RE = re.compile(
+    r'\b(?:ingredients?|instructions?|directions?|method|cups?|tsp|tbsp)\b',
+    re.IGNORECASE,
+)
+
+# Cheap recipe sniffers used to skip the LLM on pages that cannot be recipes
+_ING_RE = re.compile(
+    r'(?:\b\d+(?:[./]\d+)?|[½¼¾⅓⅔⅛])\s*'
+    r'(?:cups?|tsp|teaspoons?|tbsp|tablespoons?|oz|ounces?|grams?|g|kg|ml|l|pounds?|lbs?)\b',
+    re.IGNORECASE,
+)
+# Generic page text is whitespace-normalized, so steps are matched after any space
+_STEP_RE = re.compile(r'(?:^|\s)(?:\d{1,2}[.)]\s+[a-z]|step\s*\d+)', re.IGNORECASE)
+# Imperative cooking verbs, for instructions written as prose rather than numbered steps
+_COOKING_VERB_RE = re.compile(
+    r'\b(?:bake|mix|stir|whisk|preheat|simmer|boil|roast|fry|saut[eé]|knead|marinate|season)\b',
+    re.IGNORECASE,
+)
+
+# Candidate follow-up links found in extracted content
+_URL_RE = re.compile(r'https?://[^\s)"\'<>\]]+')
+_SOCIAL_HOSTS = (
+    'instagram.com', 'facebook.com', 'tiktok.com', 'twitter.com', 'x.com',
+    'threads.net', 'youtube.com', 'youtu.be',
+)
+
+# Single-pass platform detection; see _PLATFORM_EXTRACTORS for the dispatch
+_PLATFORM_RE = re.compile(
+    r'(?P<instagram>instagram\.com)|(?P<youtube>youtube\.com|youtu\.be)|(?P<tiktok>tiktok\.com)',
+    re.IGNORECASE,
+)
+
+# Small helpers for servings parsing, content fingerprinting and whitespace
+# normalization (one C-level substitution instead of split + join)
+_INT_RE = re.compile(r'\d+')
+_WORD_RE = re.compile(r'\w+')
+_WS_RE = re.compile(r'\s+')
+
+
+# =============================================================================
+# PAGE CACHE AND PREFETCH
+# =============================================================================
+
+# Recently fetched HTML as (raw bytes, encoding), shared by fetch_html,
+# fetch_html_bytes and the follow-up prefetcher
+_html_cache = TTLCache(maxsize=128, ttl=HTML_CACHE_TTL)
+
+# Background fetches of likely follow-up pages while the LLM is validating
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='recipe-prefetch')
+
+
+# =============================================================================
+# URL NORMALIZATION
+# =============================================================================
+
+# Query parameters that only track the click and never change the page
+_TRACKING_PARAM_PREFIXES = ('utm_', 'fbclid', 'gclid', 'igsh', 'mc_cid', 'mc_eid')
+
+
+def _canonicalize(url: str) -> str:
+    """
+    Normalize a URL so trivially different links share cache entries.
+    
+    Lowercases the host, drops the fragment and tracking parameters
+    (utm_*, fbclid, gclid, ...) and sorts the remaining query parameters.
+    
+    Example:
+        >>> _canonicalize("https://Example.com/pie?utm_source=x&b=2&a=1#top")
+        'https://example.com/pie?a=1&b=2'
+    """
+    parsed = urlparse(url)
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.startswith(_TRACKING_PARAM_PREFIXES)
+    )
+    return urlunparse(parsed._replace(
+        netloc=parsed.netloc.lower(),
+        query=urlencode(query),
+        fragment='',
+    ))
 
 
 # =============================================================================
 # PLATFORM DETECTION (reuse from extraction.py)
 # =============================================================================
 
+
 def is_instagram_url(url: str) -> bool:
     """Check if URL is from Instagram."""
     return 'instagram.com' in url.lower()
@@ -51,29 +237,68 @@ def is_tiktok_url(url: str) -> bool:
 # EXTRACTION HELPERS (reuse/adapt from extraction.py)
 # =============================================================================
 
+_INSTAGRAM_HOST = 'instagram.com/'
+_INSTAGRAM_POST_MARKERS = ('reel/', 'p/', 'tv/')
+_SHORTCODE_CHARS = frozenset(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-'
+)
+_INSTA_USER_RE = re.compile(r'instagram\.com/([A-Za-z0-9_-]+)')
+
+
+def _scan_shortcode(url: str, start: int) -> str:
+    """Return the run of shortcode characters in ``url`` beginning at ``start``."""
+    end = start
+    n = len(url)
+    while end < n and url[end] in _SHORTCODE_CHARS:
+        end += 1
+    return url[start:end]
+
+
 def extract_instagram_shortcode(url: str) -> str:
     """
     Extract shortcode from Instagram URL.
-    
+
+    Uses a plain ``str.find`` scan for the common ``/reel/``, ``/p/`` and
+    ``/tv/`` forms; the regex is only consulted for bare profile URLs.
+
     Examples:
         https://www.instagram.com/reel/DCR9-Y8Sdga -> DCR9-Y8Sdga
         https://www.instagram.com/p/ABC123/ -> ABC123
     """
-    patterns = [
-        r'instagram\.com/(?:reel|p|tv)/([A-Za-z0-9_-]+)',
-        r'instagram\.com/([A-Za-z0-9_-]+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
+    host = url.find(_INSTAGRAM_HOST)
+    if host != -1:
+        path_start = host + len(_INSTAGRAM_HOST)
+        for marker in _INSTAGRAM_POST_MARKERS:
+            if url.startswith(marker, path_start):
+                shortcode = _scan_shortcode(url, path_start + len(marker))
+                if shortcode:
+                    return shortcode
+
+    # Generic instagram.com/<username> form
+    match = _INSTA_USER_RE.search(url)
+    if match:
+        return match.group(1)
+
     raise ValueError(f"Could not extract shortcode from Instagram URL: {url}")
 
 
 # Instagram session cache (singleton pattern)
 _instagram_loader_cache = {"loader": None, "authenticated": False, "last_attempt": None}
+# Serializes loader creation so concurrent extractions log in only once
+_instagram_loader_lock = threading.Lock()
+INSTAGRAM_LOADER_CACHE_TTL = 3600  # Seconds to reuse a loader (and its login)
+# Resolved once at import (server.py loads .env before importing the agent)
+_INSTA_USER = os.getenv("INSTAGRAM_USERNAME")
+_INSTA_PASS = os.getenv("INSTAGRAM_PASSWORD")
+
+
+def _cached_instagram_loader():
+    """Return the cached (loader, is_authenticated) pair if still fresh, else None."""
+    if _instagram_loader_cache["loader"] is not None:
+        if _instagram_loader_cache["last_attempt"] and \
+           (time.time() - _instagram_loader_cache["last_attempt"]) < INSTAGRAM_LOADER_CACHE_TTL:
+            return _instagram_loader_cache["loader"], _instagram_loader_cache["authenticated"]
+    return None
 
 
 def get_authenticated_instagram_loader():
@@ -87,49 +312,52 @@ def get_authenticated_instagram_loader():
     - Checks environment for INSTAGRAM_USERNAME and INSTAGRAM_PASSWORD
     - Caches successful login to avoid re-authenticating on every call
     - Falls back to anonymous loader if login fails or no credentials
-    - Thread-safe via module-level caching
+    - Thread-safe via double-checked locking: the cached loader is read
+      without the lock, and only one thread at a time builds (and logs in)
+      a new one
     """
-    import instaloader
-    import os
-    import time
-    
     # Check cache first (avoid re-login on every call)
-    cache_ttl = 3600  # 1 hour cache
-    if _instagram_loader_cache["loader"] is not None:
-        if _instagram_loader_cache["last_attempt"] and \
-           (time.time() - _instagram_loader_cache["last_attempt"]) < cache_ttl:
-            return _instagram_loader_cache["loader"], _instagram_loader_cache["authenticated"]
-    
-    # Create new loader
-    loader = instaloader.Instaloader()
-    
-    # Disable downloads (we only need metadata)
-    loader.download_pictures = False
-    loader.download_videos = False
-    loader.download_video_thumbnails = False
-    loader.download_geotags = False
-    loader.download_comments = False
-    loader.save_metadata = False
+    cached = _cached_instagram_loader()
+    if cached is not None:
+        return cached
+    
+    with _instagram_loader_lock:
+        # Another thread may have logged in while we waited for the lock
+        cached = _cached_instagram_loader()
+        if cached is not None:
+            return cached
+        return _create_instagram_loader()
+
+
+def _create_instagram_loader():
+    """Create, authenticate and cache a new Instaloader (caller holds the lock)."""
+    # Create new loader with downloads disabled (we only need metadata)
+    loader = instaloader.Instaloader(
+        download_pictures=False,
+        download_videos=False,
+        download_video_thumbnails=False,
+        download_geotags=False,
+        download_comments=False,
+        save_metadata=False,
+        request_timeout=INSTAGRAM_REQUEST_TIMEOUT,
+    )
     
     # Attempt authentication
-    username = os.getenv("INSTAGRAM_USERNAME")
-    password = os.getenv("INSTAGRAM_PASSWORD")
-    
     authenticated = False
-    if username and password:
+    if _INSTA_USER and _INSTA_PASS:
         try:
-            print(f"Attempting Instagram login for user: {username}")
-            loader.login(username, password)
+            logger.info("Attempting Instagram login for user: %s", _INSTA_USER)
+            loader.login(_INSTA_USER, _INSTA_PASS)
             authenticated = True
-            print("Instagram login successful")
+            logger.info("Instagram login successful")
         except instaloader.exceptions.BadCredentialsException:
-            print(f"WARNING: Instagram login failed - invalid credentials for {username}")
+            logger.warning("Instagram login failed - invalid credentials for %s", _INSTA_USER)
         except instaloader.exceptions.ConnectionException as e:
-            print(f"WARNING: Instagram login failed - connection error: {e}")
+            logger.warning("Instagram login failed - connection error: %s", e)
         except Exception as e:
-            print(f"WARNING: Instagram login failed - {type(e).__name__}: {e}")
+            logger.warning("Instagram login failed - %s: %s", type(e).__name__, e)
     else:
-        print("INFO: No Instagram credentials found in environment, using anonymous access")
+        logger.info("No Instagram credentials found in environment, using anonymous access")
     
     # Cache result
     _instagram_loader_cache["loader"] = loader
@@ -139,6 +367,66 @@ def get_authenticated_instagram_loader():
     return loader, authenticated
 
 
+_HEAD_END_RE = re.compile(rb'</head\s*>', re.IGNORECASE)
+
+
+def _html_head(html: bytes) -> bytes:
+    """Return ``html`` up to and including ``</head>`` (the whole page if there is none)."""
+    match = _HEAD_END_RE.search(html)
+    return html[:match.end()] if match else html
+
+
+# Meta tags tried in order by extract_instagram_with_html: (name/property
+# value, the attribute holding it, whether the content doubles as the full
+# title - otherwise it is shortened to 100 chars)
+_INSTAGRAM_META_TAGS = (
+    ('description', 'name', False),
+    ('og:title', 'property', True),
+    ('og:description', 'property', False),
+)
+_META_TAG_RE = re.compile(r'<meta\b[^>]*>', re.IGNORECASE)
+_META_ATTR_RE = re.compile(
+    r'\b(name|property|content)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')',
+    re.IGNORECASE,
+)
+
+
+def _scan_meta_tags(html: str) -> dict:
+    """
+    Collect the non-empty Instagram meta tag contents with a regex scan.
+    
+    Handles either attribute order and both quote styles without building a
+    DOM. Returns a dict of name/property -> unescaped content (first wins).
+    """
+    wanted = {key for key, _, _ in _INSTAGRAM_META_TAGS}
+    found = {}
+    for tag in _META_TAG_RE.finditer(html):
+        attrs = {}
+        for attr, double_quoted, single_quoted in _META_ATTR_RE.findall(tag.group(0)):
+            attrs.setdefault(attr.lower(), double_quoted or single_quoted)
+        key = (attrs.get('name') or attrs.get('property') or '').lower()
+        if key in wanted and key not in found:
+            content = html_lib.unescape(attrs.get('content', '')).strip()
+            if content:
+                found[key] = content
+    return found
+
+
+def _parse_meta_tags(head: bytes) -> dict:
+    """
+    Collect the non-empty Instagram meta tag contents from a parsed tree.
+    
+    Used when the regex scan finds nothing, e.g. on unusual markup.
+    """
+    found = {}
+    root = lxml.html.fromstring(head, parser=lxml.html.HTMLParser(encoding='utf-8'))
+    for key, attr, _ in _INSTAGRAM_META_TAGS:
+        values = root.xpath(f'//meta[@{attr}="{key}"]/@content')
+        if values and values[0].strip():
+            found[key] = values[0].strip()
+    return found
+
+
 def extract_instagram_with_html(url: str) -> tuple[str, str]:
     """
     Extract Instagram content using HTML meta tags (PRIMARY METHOD).
@@ -160,34 +448,24 @@ def extract_instagram_with_html(url: str) -> tuple[str, str]:
         ValueError: If no meta tag data is found
     """
     try:
-        # Fetch HTML using existing utility
-        html = fetch_html(url)
-        soup = BeautifulSoup(html, 'lxml')
+        # Fetch raw bytes: Instagram always serves UTF-8, so there is no
+        # need to detect the charset or decode the (much larger) body
+        html = fetch_html_bytes(url)
+        # The meta tags live in <head>; skip parsing the body
+        head_bytes = _html_head(html)
+        head = head_bytes.decode('utf-8', errors='replace')
+        
+        # Fast path: regex scan, no tree. Fall back to a real parser only
+        # when the scan finds nothing, e.g. on unusual markup.
+        found = _scan_meta_tags(head) or _parse_meta_tags(head_bytes)
         
         # Try meta tags in fallback order
-        content = None
-        title = "Instagram Post"
-        
-        # 1. Try <meta name="description">
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content', '').strip():
-            content = meta_desc['content'].strip()
-            title = content[:100] + '...' if len(content) > 100 else content
-            return content, title
-        
-        # 2. Try <meta property="og:title">
-        og_title = soup.find('meta', property='og:title')
-        if og_title and og_title.get('content', '').strip():
-            content = og_title['content'].strip()
-            title = content
-            return content, title
-        
-        # 3. Try <meta property="og:description">
-        og_desc = soup.find('meta', property='og:description')
-        if og_desc and og_desc.get('content', '').strip():
-            content = og_desc['content'].strip()
-            title = content[:100] + '...' if len(content) > 100 else content
-            return content, title
+        for key, _, full_title in _INSTAGRAM_META_TAGS:
+            content = found.get(key)
+            if content:
+                if full_title or len(content) <= 100:
+                    return content, content
+                return content, content[:100] + '...'
         
         # No meta tags found
         raise ValueError("No content found in HTML meta tags")
@@ -216,9 +494,7 @@ def extract_instagram_with_instaloader(url: str) -> tuple[str, str]:
         - Falls back to anonymous access if authentication fails
         - Anonymous access may fail with 401 in cloud environments
     """
-    try:
-        import instaloader
-    except ImportError:
+    if instaloader is None:
         raise ImportError(
             "instaloader is not installed. Install it with: pip install instaloader"
         )
@@ -276,10 +552,22 @@ def extract_text_from_instagram(url: str) -> tuple[str, str]:
     """
     Extract text from Instagram post/reel using multiple extraction methods.
     
-    Strategy (tries in order):
+    Strategy:
     1. HTML meta tags (PRIMARY) - Simple, fast, no external API dependencies
     2. instaloader (FALLBACK) - Requires authentication, may fail on cloud IPs
     
+    The fallback starts as soon as the HTML method fails, or once it has
+    run for INSTAGRAM_HEDGE_DELAY seconds without finishing; the first
+    method to succeed wins. A slow HTML fetch therefore costs roughly
+    max(html, instaloader) instead of their sum, while the common fast
+    HTML success never touches instaloader (which logs in to Instagram).
+    
+    Each call gets its own two-thread executor, so a hung request only
+    ever ties up its own call. The caller stops waiting after
+    INSTAGRAM_EXTRACTION_TIMEOUT seconds; a losing or abandoned method is
+    left to hit its request timeout in the background, and its retry
+    backoff is cancelled so it does not start another attempt.
+    
     Args:
         url: Instagram URL
         
@@ -292,22 +580,50 @@ def extract_text_from_instagram(url: str) -> tuple[str, str]:
     errors = []
     
     # PRIMARY: Try HTML meta tags first (simple and fast)
+    logger.debug("Attempting Instagram extraction with HTML meta tags (primary method)")
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='instagram-extract')
+    cancel_retries = threading.Event()
+    deadline = time.monotonic() + INSTAGRAM_EXTRACTION_TIMEOUT
     try:
-        print(f"Attempting Instagram extraction with HTML meta tags (primary method)...")
-        return extract_instagram_with_html(url)
-    except Exception as e:
-        error_msg = str(e)
-        errors.append(f"HTML meta tags: {error_msg}")
-        print(f"HTML extraction failed: {error_msg}")
-    
-    # FALLBACK: Try instaloader with authentication
-    try:
-        print(f"Attempting Instagram extraction with instaloader (fallback method)...")
-        return extract_instagram_with_instaloader(url)
-    except Exception as e:
-        error_msg = str(e)
-        errors.append(f"instaloader: {error_msg}")
-        print(f"instaloader extraction failed: {error_msg}")
+        futures = {
+            executor.submit(call_with_cancel_event, cancel_retries, extract_instagram_with_html, url):
+                "HTML meta tags"
+        }
+        fallback_started = False
+        
+        while futures:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                errors.extend(
+                    f"{method}: timed out after {INSTAGRAM_EXTRACTION_TIMEOUT:g}s"
+                    for method in futures.values()
+                )
+                break
+            done, _ = wait(
+                futures,
+                timeout=remaining if fallback_started else min(remaining, INSTAGRAM_HEDGE_DELAY),
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                method = futures.pop(future)
+                try:
+                    return future.result()
+                except Exception as e:
+                    error_msg = str(e)
+                    errors.append(f"{method}: {error_msg}")
+                    logger.debug("%s extraction failed: %s", method, error_msg)
+            
+            # FALLBACK: Try instaloader with authentication (HTML failed or is slow)
+            if not fallback_started:
+                fallback_started = True
+                logger.debug("Attempting Instagram extraction with instaloader (fallback method)")
+                futures[executor.submit(
+                    call_with_cancel_event, cancel_retries, extract_instagram_with_instaloader, url
+                )] = "instaloader"
+    finally:
+        # Don't wait for the loser; its thread exits once its request returns
+        cancel_retries.set()
+        executor.shutdown(wait=False, cancel_futures=True)
     
     # Both methods failed - provide comprehensive error
     error_details = "\n".join(f"  • {err}" for err in errors)
@@ -321,6 +637,17 @@ def extract_text_from_instagram(url: str) -> tuple[str, str]:
     )
 
 
+# Metadata-only yt-dlp options shared by the video extractors: never
+# download media and never expand playlists into per-entry requests
+_YTDLP_BASE_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'skip_download': True,
+    'extract_flat': 'in_playlist',
+}
+_YTDLP_SUBTITLE_LANGS = ['en', 'en-US', 'en-GB']
+
+
 def extract_text_from_youtube(url: str) -> tuple[str, str]:
     """
     Extract text from YouTube video using yt-dlp.
@@ -341,12 +668,10 @@ def extract_text_from_youtube(url: str) -> tuple[str, str]:
     
     # Configure yt-dlp options
     ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'skip_download': True,
+        **_YTDLP_BASE_OPTS,
         'writesubtitles': True,
         'writeautomaticsub': True,
-        'subtitleslangs': ['en', 'en-US', 'en-GB'],
+        'subtitleslangs': _YTDLP_SUBTITLE_LANGS,
         'subtitlesformat': 'vtt',
     }
     
@@ -371,7 +696,7 @@ def extract_text_from_youtube(url: str) -> tuple[str, str]:
             if info.get('uploader'):
                 text_parts.append(f"\nChannel: {info['uploader']}")
             
-            # Extract captions/subtitles
+            # Extract captions/subtitles (listed in info even without downloading)
             subtitles = info.get('subtitles') or {}
             automatic_captions = info.get('automatic_captions') or {}
             
@@ -379,7 +704,7 @@ def extract_text_from_youtube(url: str) -> tuple[str, str]:
             all_subs = {**automatic_captions, **subtitles}
             
             caption_text = None
-            for lang in ['en', 'en-US', 'en-GB']:
+            for lang in _YTDLP_SUBTITLE_LANGS:
                 if lang in all_subs:
                     # Get the subtitle data
                     sub_data = all_subs[lang]
@@ -427,11 +752,14 @@ def extract_text_from_tiktok(url: str) -> tuple[str, str]:
             "yt-dlp is not installed. Install it with: pip install yt-dlp"
         )
     
-    # Configure yt-dlp options for TikTok
+    # Configure yt-dlp options for TikTok: metadata only, no subtitle
+    # probing, and fail fast rather than retrying a blocked request
     ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'skip_download': True,
+        **_YTDLP_BASE_OPTS,
+        'writesubtitles': False,
+        'writeautomaticsub': False,
+        'extractor_retries': 1,
+        'socket_timeout': 5,
     }
     
     text_parts = []
@@ -482,14 +810,93 @@ def extract_text_from_tiktok(url: str) -> tuple[str, str]:
     return content, title
 
 
-@with_retry(max_attempts=3, backoff_factor=1.0)
-def fetch_html(url: str, timeout: int = 10) -> str:
+# Host -> semaphore capping concurrent page downloads, so batches and parallel
+# follow-ups never hit one site with more than DOMAIN_CONCURRENCY_LIMIT requests
+_domain_semaphores: dict = {}
+_domain_semaphores_lock = threading.Lock()
+
+
+def _domain_semaphore(url: str) -> Union[threading.Semaphore, contextlib.nullcontext]:
+    """Return the per-host download semaphore for ``url`` (a no-op when unlimited)."""
+    if DOMAIN_CONCURRENCY_LIMIT <= 0:
+        return contextlib.nullcontext()
+    host = urlparse(url).hostname or ''
+    with _domain_semaphores_lock:
+        semaphore = _domain_semaphores.get(host)
+        if semaphore is None:
+            semaphore = _domain_semaphores[host] = threading.Semaphore(DOMAIN_CONCURRENCY_LIMIT)
+        return semaphore
+
+
+@with_retry(max_attempts=3, backoff_factor=1.0, retriable_exceptions=RETRIABLE_HTTP_EXCEPTIONS)
+def _download_html(url: str, timeout: int, session: Optional[requests.Session]) -> tuple[bytes, str]:
+    """
+    Download a page (or serve it from _html_cache) as (raw bytes, encoding).
+    
+    Retries transient errors. The encoding is the one declared by the
+    response headers, defaulting to UTF-8. At most DOMAIN_CONCURRENCY_LIMIT
+    downloads run against one host at a time; cache hits skip the limit.
+    """
+    if not url.startswith(('https://')):
+        raise ValueError("URL must start with 'https://'")
+    cache_key = _canonicalize(url)
+    cached = _html_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    session = session or SESSION
+    with _domain_semaphore(url), \
+            session.get(url, timeout=timeout, allow_redirects=True, stream=True) as response:
+        response.raise_for_status()
+        
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=16384):
+            body.extend(chunk)
+            if len(body) >= MAX_HTML_BYTES:
+                break
+        encoding = response.encoding or 'utf-8'
+    
+    page = (bytes(body), encoding)
+    _html_cache.set(cache_key, page)
+    return page
+
+
+def fetch_html_bytes(url: str, timeout: int = 10, session: Optional[requests.Session] = None) -> bytes:
+    """
+    Fetch the raw, undecoded HTML bytes of a URL.
+    
+    Same download, retry, size cap and cache as fetch_html, but skips
+    decoding so callers that know the page's charset (or only need part of
+    it) can decode just what they use.
+    
+    Args:
+        url: The URL to fetch
+        timeout: Request timeout in seconds
+        session: Session to fetch with (default: the shared pooled session)
+        
+    Returns:
+        HTML content as bytes (at most MAX_HTML_BYTES, plus one chunk)
+        
+    Raises:
+        requests.exceptions.RequestException: For network-related errors
+    """
+    return _download_html(url, timeout, session)[0]
+
+
+def fetch_html(url: str, timeout: int = 10, session: Optional[requests.Session] = None) -> str:
     """
     Fetch HTML content from a URL with automatic retry on transient errors.
     
+    The body is streamed and the download stops after MAX_HTML_BYTES, which
+    bounds bandwidth and parse time on very large pages (the recipe and its
+    JSON-LD are well within the first megabyte). Pages fetched in the last
+    HTML_CACHE_TTL seconds, including speculative prefetches, are served
+    from memory.
+    
     Args:
         url: The URL to fetch
         timeout: Request timeout in seconds
+        session: Session to fetch with (default: the shared pooled session)
         
     Returns:
         HTML content as string
@@ -497,71 +904,386 @@ def fetch_html(url: str, timeout: int = 10) -> str:
     Raises:
         requests.exceptions.RequestException: For network-related errors
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-    }
+    body, encoding = _download_html(url, timeout, session)
+    return body.decode(encoding, errors='replace')
+
+
+class _HTMLTextCollector:
+    """
+    lxml parser target that gathers visible text as the HTML streams past.
     
-    if not url.startswith(('https://')):
-        raise ValueError("URL must start with 'https://'")
-    response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-    response.raise_for_status()
+    No tree is built: memory is bounded by the text itself plus the count
+    of currently open script/style/noscript elements.
+    
+    lxml delivers one text node in several data() calls (it splits at
+    entity and character references), so pieces are joined with no
+    separator; a space is added at block-level boundaries instead, so
+    "Tom &amp; Jerry" stays intact while <li>s and <p>s don't run together.
+    """
     
-    return response.text
+    _SKIP_TAGS = frozenset(('script', 'style', 'noscript'))
+    _BLOCK_TAGS = frozenset((
+        'address', 'article', 'aside', 'blockquote', 'body', 'br', 'caption', 'dd',
+        'details', 'div', 'dl', 'dt', 'figcaption', 'figure', 'footer', 'form',
+        'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'head', 'header', 'hr', 'li', 'main',
+        'nav', 'ol', 'p', 'pre', 'section', 'summary', 'table', 'tbody', 'td',
+        'tfoot', 'th', 'thead', 'title', 'tr', 'ul',
+    ))
+    
+    def __init__(self):
+        self.parts = []
+        self._skip_depth = 0
+    
+    def start(self, tag, attrib):
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self._BLOCK_TAGS:
+            self.parts.append(' ')
+    
+    def end(self, tag):
+        if tag in self._SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in self._BLOCK_TAGS:
+            self.parts.append(' ')
+    
+    def data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+    
+    def close(self) -> str:
+        # Normalize whitespace
+        return _WS_RE.sub(' ', ''.join(self.parts)).strip()
+
+
+class _HTMLPageCollector(_HTMLTextCollector):
+    """
+    Streaming collector for visible text, the first <title> and JSON-LD blocks.
+    
+    Title and JSON-LD pieces are joined like text nodes (no separator), so
+    entities in the title survive. ``close()`` returns
+    (text, title, json_ld_blocks).
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.title = ""
+        self.json_ld_blocks = []
+        self._title_parts = None  # list while inside the first <title>
+        self._title_seen = False
+        self._json_ld_parts = None  # list while inside an ld+json <script>
+    
+    def start(self, tag, attrib):
+        super().start(tag, attrib)
+        if tag == 'title' and not self._title_seen:
+            self._title_parts = []
+        elif tag == 'script' and attrib.get('type', '').strip().lower() == 'application/ld+json':
+            self._json_ld_parts = []
+    
+    def end(self, tag):
+        super().end(tag)
+        if tag == 'title' and self._title_parts is not None:
+            self.title = _WS_RE.sub(' ', ''.join(self._title_parts)).strip()
+            self._title_parts = None
+            self._title_seen = True
+        elif tag == 'script' and self._json_ld_parts is not None:
+            self.json_ld_blocks.append(''.join(self._json_ld_parts))
+            self._json_ld_parts = None
+    
+    def data(self, data):
+        super().data(data)
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        if self._json_ld_parts is not None:
+            self._json_ld_parts.append(data)
+    
+    def close(self) -> tuple[str, str, List[str]]:
+        return super().close(), self.title, self.json_ld_blocks
+
+
+def _stream_html(html: str, collector):
+    """Feed ``html`` through lxml's HTML parser into a target ``collector``."""
+    parser = etree.HTMLParser(target=collector)
+    parser.feed(html)
+    return parser.close()
 
 
 def extract_text_from_html(html: str) -> str:
     """
     Extract all visible text from HTML content.
     
+    The document is streamed through lxml's parser rather than built into
+    a soup tree, skipping script, style and noscript content.
+    
     Args:
         html: Raw HTML content
         
     Returns:
         Extracted text content with whitespace normalized
     """
-    soup = BeautifulSoup(html, 'lxml')
-    
-    # Remove script, style, and other non-visible elements
-    for element in soup(['script', 'style', 'noscript']):
-        element.decompose()
-    # Get all text
-    text = soup.get_text(separator=' ', strip=True)
-    
-    # Normalize whitespace
-    text = ' '.join(text.split())
-    
-    return text
+    return _stream_html(html, _HTMLTextCollector())
+
+
+_TITLE_RE = re.compile(r'<title\b[^>]*>([^<]*)</title\s*>', re.IGNORECASE | re.DOTALL)
 
 
 def extract_html_title(html: str) -> str:
     """
     Extract <title> tag from HTML.
     
+    A regex finds the common plain-text title without parsing the page;
+    lxml is only used when it misses (e.g. markup inside the title).
+    
     Args:
         html: Raw HTML content
         
     Returns:
         Title text or "Web Page" if not found
     """
+    match = _TITLE_RE.search(html)
+    if match:
+        return html_lib.unescape(match.group(1)).strip() or "Web Page"
     try:
-        soup = BeautifulSoup(html, 'lxml')
-        title_tag = soup.find('title')
-        return title_tag.get_text().strip() if title_tag else "Web Page"
+        title = lxml.html.fromstring(html).findtext('.//title')
+        return title.strip() if title and title.strip() else "Web Page"
     except Exception:
         return "Web Page"
 
 
+def _parse_html(html: str) -> tuple[str, str, Optional[dict]]:
+    """
+    Extract visible text, <title> and any JSON-LD Recipe from HTML with a single parse.
+    
+    Equivalent to calling extract_text_from_html() and extract_html_title()
+    but streams the document through the parser once, without building a
+    tree.
+    
+    Args:
+        html: Raw HTML content
+        
+    Returns:
+        Tuple of (text, title, json_ld_recipe); title is "Web Page" if not
+        found, json_ld_recipe is the schema.org Recipe node or None
+    """
+    text, title, json_ld_blocks = _stream_html(html, _HTMLPageCollector())
+    return text, title or "Web Page", _find_json_ld_recipe(json_ld_blocks)
+
+
+# =============================================================================
+# JSON-LD RECIPE FAST PATH
+# =============================================================================
+
+# Leading quantity of an ingredient line: "2", "1.5", "1/2", "1 1/2", "2-3", "½"
+_QUANTITY_RE = re.compile(
+    r'^(\d*\s*[½¼¾⅓⅔⅛]|(?:\d+\s+)?\d+(?:[./]\d+)?(?:\s*(?:-|to)\s*\d+(?:[./]\d+)?)?)\s*'
+)
+_UNIT_RE = re.compile(
+    r'^(cups?|tablespoons?|tbsps?|teaspoons?|tsps?|ounces?|oz|pounds?|lbs?|grams?|g|'
+    r'kilograms?|kg|millilit(?:er|re)s?|ml|lit(?:er|re)s?|l|cloves?|pinch(?:es)?|'
+    r'cans?|slices?|sticks?)\b\.?\s*',
+    re.IGNORECASE,
+)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_ISO_DURATION_RE = re.compile(r'^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$', re.IGNORECASE)
+
+
+def _find_json_ld_recipe(blocks: List[str]) -> Optional[dict]:
+    """Return the first schema.org Recipe node from the page's JSON-LD blocks."""
+    for block in blocks:
+        try:
+            data = _json_loads(block)
+        except ValueError:
+            continue
+        recipe = _find_recipe_node(data)
+        if recipe is not None:
+            return recipe
+    return None
+
+
+def _find_recipe_node(data) -> Optional[dict]:
+    """Search a decoded JSON-LD value (including @graph) for a Recipe node."""
+    if isinstance(data, list):
+        for item in data:
+            recipe = _find_recipe_node(item)
+            if recipe is not None:
+                return recipe
+    elif isinstance(data, dict):
+        node_type = data.get('@type')
+        node_types = node_type if isinstance(node_type, list) else [node_type]
+        if 'Recipe' in node_types:
+            return data
+        for key in ('@graph', 'mainEntity'):
+            if key in data:
+                recipe = _find_recipe_node(data[key])
+                if recipe is not None:
+                    return recipe
+    return None
+
+
+def _clean_ld_text(value) -> str:
+    """
+    Flatten a JSON-LD text value: unescape entities, drop tags, squeeze spaces.
+    
+    Nulls and anything that is not text (numbers, objects without a
+    text/name) become '', never their repr.
+    """
+    if isinstance(value, list):
+        value = value[0] if value else ''
+    if isinstance(value, dict):
+        value = value.get('text') or value.get('name') or ''
+    if not isinstance(value, str):
+        return ''
+    text = _HTML_TAG_RE.sub(' ', html_lib.unescape(value))
+    return _WS_RE.sub(' ', text).strip()
+
+
+def _parse_ingredient(line: str) -> dict:
+    """Split an ingredient line like "1 1/2 cups flour" into name/quantity/unit."""
+    text = _clean_ld_text(line)
+    quantity: Union[float, str] = ''
+    unit = ''
+    
+    match = _QUANTITY_RE.match(text)
+    if match:
+        raw_quantity = match.group(1).strip()
+        try:
+            quantity = float(raw_quantity)
+        except ValueError:
+            quantity = raw_quantity
+        text = text[match.end():]
+        unit_match = _UNIT_RE.match(text)
+        if unit_match:
+            unit = unit_match.group(1)
+            text = text[unit_match.end():]
+    
+    return {'name': text.strip() or _clean_ld_text(line), 'quantity': quantity, 'unit': unit}
+
+
+def _ld_steps(instructions) -> List[str]:
+    """Flatten recipeInstructions (text, HowToStep, HowToSection) into step strings."""
+    if not instructions:
+        return []
+    if isinstance(instructions, str):
+        text = _HTML_TAG_RE.sub('\n', html_lib.unescape(instructions))
+        return [_WS_RE.sub(' ', line).strip() for line in text.splitlines() if line.strip()]
+    if isinstance(instructions, dict):
+        if 'itemListElement' in instructions:
+            return _ld_steps(instructions['itemListElement'])
+        step = _clean_ld_text(instructions)
+        return [step] if step else []
+    if not isinstance(instructions, list):
+        return []
+    steps = []
+    for item in instructions:
+        steps.extend(_ld_steps(item))
+    return steps
+
+
+def _ld_duration(value) -> Optional[str]:
+    """Render an ISO 8601 duration (e.g. "PT1H30M") as "1 hour 30 minutes"."""
+    if not isinstance(value, str):
+        return None
+    match = _ISO_DURATION_RE.match(value.strip())
+    if not match or not any(match.groups()):
+        return value.strip() or None
+    parts = []
+    for amount, label in zip(match.groups(), ('day', 'hour', 'minute', 'second')):
+        if amount and int(amount):
+            parts.append(f"{int(amount)} {label}{'s' if int(amount) != 1 else ''}")
+    return ' '.join(parts) or None
+
+
+def _ld_servings(value) -> Optional[int]:
+    """Extract the first integer from recipeYield ("4", "4 servings", ["4", ...])."""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = _INT_RE.search(str(value or ''))
+    return int(match.group(0)) if match else None
+
+
+def _ld_list(value) -> List[str]:
+    """Normalize a JSON-LD string-or-list field (comma-separated strings split)."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        items = value.split(',')
+    elif isinstance(value, list):
+        items = value
+    else:
+        items = [value]
+    cleaned = (_clean_ld_text(item) for item in items)
+    return [item for item in cleaned if item]
+
+
+def _recipe_data_from_json_ld(node: dict) -> Optional[RecipeDataForLLM]:
+    """
+    Convert a schema.org Recipe node into RecipeDataForLLM.
+    
+    Returns None unless the node has a name, ingredients and instructions,
+    so incomplete markup still goes through LLM validation.
+    """
+    title = _clean_ld_text(node.get('name', ''))
+    ingredient_lines = node.get('recipeIngredient') or node.get('ingredients') or []
+    if not isinstance(ingredient_lines, list):
+        ingredient_lines = [ingredient_lines]
+    ingredients = [_parse_ingredient(line) for line in ingredient_lines if _clean_ld_text(line)]
+    ingredients = [ingredient for ingredient in ingredients if ingredient['name']]
+    steps = _ld_steps(node.get('recipeInstructions'))
+    if not title or not ingredients or not steps:
+        return None
+    
+    cuisines = _ld_list(node.get('recipeCuisine'))
+    tags = []
+    for tag in _ld_list(node.get('recipeCategory')) + cuisines + _ld_list(node.get('keywords')):
+        if tag.lower() not in tags:
+            tags.append(tag.lower())
+    
+    try:
+        return RecipeDataForLLM(
+            title=title,
+            ingredients=ingredients,
+            steps=steps,
+            tags=tags[:10],
+            servings=_ld_servings(node.get('recipeYield')),
+            prep_time=_ld_duration(node.get('prepTime')),
+            cook_time=_ld_duration(node.get('cookTime')),
+            total_time=_ld_duration(node.get('totalTime')),
+            cuisine=cuisines[0] if cuisines else None,
+        )
+    except ValueError:
+        return None
+
+
 # =============================================================================
 # INTERNAL EXTRACTION LOGIC
 # =============================================================================
 
 class SimpleExtractionResult:
     """Internal lightweight extraction result."""
-    def __init__(self, content: str, title: str, success: bool, error: Optional[str] = None):
+    def __init__(
+        self,
+        content: str,
+        title: str,
+        success: bool,
+        error: Optional[str] = None,
+        recipe_data: Optional[RecipeDataForLLM] = None,
+        permanent: bool = False,
+    ):
         self.content = content
         self.title = title
         self.success = success
         self.error = error
+        self.recipe_data = recipe_data  # Set when the page embeds a complete JSON-LD Recipe
+        self.permanent = permanent  # Failure that retrying soon will not fix (bad URL, 404, ...)
+
+
+# Platform (the _PLATFORM_RE group that matched) -> platform-specific extractor
+_PLATFORM_EXTRACTORS = {
+    'instagram': extract_text_from_instagram,
+    'youtube': extract_text_from_youtube,
+    'tiktok': extract_text_from_tiktok,
+}
 
 
 def _extract_content(url: str) -> SimpleExtractionResult:
@@ -569,27 +1291,73 @@ def _extract_content(url: str) -> SimpleExtractionResult:
     Extract content from URL using platform-specific extractors.
     Internal function - reuses existing extraction logic.
     
+    Successful extractions are reused for EXTRACTION_CACHE_TTL seconds, so
+    re-runs and follow-up loops over the same URL skip the network and
+    parsing entirely. Permanent failures (invalid or unsupported URL, 4xx
+    other than 408/429) are remembered for FAILED_EXTRACTION_CACHE_TTL
+    seconds so a bad link revisited by follow-ups does not re-run the whole
+    fetch/fallback chain. Transient ones (timeouts, connection errors,
+    429/5xx, platform blocks) are not cached, so a retry tries again.
+    
     Returns:
         SimpleExtractionResult with content or error
     """
+    url = _canonicalize(url)
+    cache_key = url.rstrip('/')
+    cached = _extraction_cache.get(cache_key)
+    if cached is None:
+        cached = _failed_extraction_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    result = _extract_content_uncached(url)
+    if result.success:
+        _extraction_cache.set(cache_key, result)
+    elif result.permanent:
+        _failed_extraction_cache.set(cache_key, result)
+    return result
+
+
+def _extract_content_batch(urls: List[str]) -> List[SimpleExtractionResult]:
+    """
+    Extract several URLs concurrently.
+    
+    Requests run on up to EXTRACTION_BATCH_WORKERS threads; page downloads
+    are still capped per host by DOMAIN_CONCURRENCY_LIMIT.
+    
+    Args:
+        urls: URLs to extract
+        
+    Returns:
+        List of SimpleExtractionResult, in the same order as ``urls``
+    """
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(urls), EXTRACTION_BATCH_WORKERS)) as executor:
+        return list(executor.map(_extract_content, urls))
+
+
+def _extract_content_uncached(url: str) -> SimpleExtractionResult:
+    """Extract content from a canonical URL, bypassing the extraction cache."""
+    recipe_data = None
     try:
         # Route to platform-specific extractors
-        if is_instagram_url(url):
-            content, title = extract_text_from_instagram(url)
-        elif is_youtube_url(url):
-            content, title = extract_text_from_youtube(url)
-        elif is_tiktok_url(url):
-            content, title = extract_text_from_tiktok(url)
+        match = _PLATFORM_RE.search(url)
+        extractor = _PLATFORM_EXTRACTORS[match.lastgroup] if match else None
+        if extractor:
+            content, title = extractor(url)
         else:
             # Generic HTML extraction
             html = fetch_html(url)
-            content = extract_text_from_html(html)
-            title = extract_html_title(html)
+            content, title, json_ld_recipe = _parse_html(html)
+            if json_ld_recipe is not None:
+                recipe_data = _recipe_data_from_json_ld(json_ld_recipe)
         
         return SimpleExtractionResult(
             content=content,
             title=title,
-            success=True
+            success=True,
+            recipe_data=recipe_data
         )
         
     except ImportError as e:
@@ -597,14 +1365,16 @@ def _extract_content(url: str) -> SimpleExtractionResult:
             content="",
             title="",
             success=False,
-            error=f"Missing dependency: {str(e)}"
+            error=f"Missing dependency: {str(e)}",
+            permanent=True
         )
     except ValueError as e:
         return SimpleExtractionResult(
             content="",
             title="",
             success=False,
-            error=f"Invalid URL format: {str(e)}"
+            error=f"Invalid URL format: {str(e)}",
+            permanent=True
         )
     except requests.exceptions.Timeout:
         return SimpleExtractionResult(
@@ -614,11 +1384,13 @@ def _extract_content(url: str) -> SimpleExtractionResult:
             error=f"Request timed out while fetching {url}"
         )
     except requests.exceptions.HTTPError as e:
+        status_code = e.response.status_code
         return SimpleExtractionResult(
             content="",
             title="",
             success=False,
-            error=f"HTTP {e.response.status_code} error while fetching {url}"
+            error=f"HTTP {status_code} error while fetching {url}",
+            permanent=400 <= status_code < 500 and status_code not in (408, 429)
         )
     except requests.exceptions.RequestException as e:
         return SimpleExtractionResult(
@@ -658,166 +1430,823 @@ def _extract_content(url: str) -> SimpleExtractionResult:
 # VALIDATION + FORMATTING (COMBINED LLM CALL)
 # =============================================================================
 
-def _validate_and_format_combined(
-    content: str,
-    url: str,
-    depth: int
-) -> ValidateAndFormatOutput:
+def _smart_truncate(content: str, max_length: int) -> str:
     """
-    Validate and format recipe content in a single LLM call.
+    Truncate content to ``max_length`` characters, keeping the recipe-dense part.
     
-    Uses structured output to get:
-    - Validation result (is_valid_recipe, has_ingredients, has_instructions)
-    - Structured JSON recipe data (if valid)
-    - Follow-up URL (if invalid and URLs present)
+    Finds the window of ``max_length`` characters containing the most recipe
+    keywords (ingredients, instructions, cups, tsp, ...) and centres the
+    returned slice on that cluster. Falls back to the leading characters when
+    no keywords are present.
     
     Args:
         content: Extracted text content
-        url: Source URL
-        depth: Current extraction depth
+        max_length: Maximum number of characters to keep
         
     Returns:
-        ValidateAndFormatOutput with validation + JSON formatting results
+        Content slice of at most ``max_length`` characters
     """
+    if len(content) <= max_length:
+        return content
+    
+    positions = [m.start() for m in _RECIPE_KEYWORD_RE.finditer(content)]
+    if not positions:
+        return content[:max_length]
+    
+    # Sliding window over keyword positions: densest run within max_length
+    best_start, best_end, best_count = 0, 0, 0
+    end = 0
+    for start in range(len(positions)):
+        while end < len(positions) and positions[end] - positions[start] < max_length:
+            end += 1
+        if end - start > best_count:
+            best_start, best_end, best_count = start, end - 1, end - start
+    
+    center = (positions[best_start] + positions[best_end]) // 2
+    window_start = min(max(0, center - max_length // 2), len(content) - max_length)
+    return content[window_start:window_start + max_length]
+
+
+@lru_cache(maxsize=1)
+def _token_encoder():
+    """Return the tiktoken encoder, or None if tiktoken is unavailable."""
+    if tiktoken is None:
+        return None
     try:
-        model = get_model()
-        
-        structured_model = model.with_structured_output(ValidateAndFormatOutput)
-        
-        # Truncate content to avoid token limits
-        truncated_content = content #[:CONTENT_TRUNCATE_LENGTH]
-        
-        prompt_template = ChatPromptTemplate.from_messages([
-            (
-                "system",
-                VALIDATE_AND_FORMAT_PROMPT,
-            )
-        ])
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # The BPE file could not be loaded (e.g. offline first run)
+        return None
 
-        prompt_messages = prompt_template.format_messages(
-            content=truncated_content,
-            url=url,
-            depth=depth,
-        )
 
-        result = structured_model.invoke(prompt_messages)
-        # Ensure we return a ValidateAndFormatOutput instance
-        if isinstance(result, dict):
-            return ValidateAndFormatOutput(**result)
-        return result
-        
-    except Exception as e:
-        # Fallback to failed validation
-        return ValidateAndFormatOutput(
-            is_valid_recipe=False,
-            recipe_data=None,
-            recipe_name=None,
-            has_ingredients=False,
-            has_instructions=False,
-            follow_up_url=None,
-            follow_up_confidence=0.0,
-            reason=f"Validation/formatting failed: {str(e)}",
-            confidence=0.0
-        )
+def _truncate_for_llm(content: str) -> str:
+    """
+    Fit ``content`` into the LLM input budget.
+    
+    With tiktoken the budget is CONTENT_TRUNCATE_TOKENS tokens: English
+    pages get their full budget and dense scripts (CJK) cannot overshoot it.
+    The recipe-dense window is chosen by ``_smart_truncate`` using the
+    page's own chars-per-token ratio, then clipped to the exact token count.
+    Without tiktoken, CONTENT_TRUNCATE_LENGTH characters are kept.
+    """
+    encoder = _token_encoder()
+    if encoder is None:
+        return _smart_truncate(content, CONTENT_TRUNCATE_LENGTH)
+    
+    tokens = encoder.encode_ordinary(content)
+    if len(tokens) <= CONTENT_TRUNCATE_TOKENS:
+        return content
+    window = _smart_truncate(content, len(content) * CONTENT_TRUNCATE_TOKENS // len(tokens))
+    return encoder.decode(encoder.encode_ordinary(window)[:CONTENT_TRUNCATE_TOKENS])
 
 
-# =============================================================================
-# RECURSIVE EXTRACTION LOGIC
-# =============================================================================
+def _validate_format_cache_key(content: str, url: str) -> str:
+    """Build the exact-match cache key for a validation/formatting call."""
+    raw = f"{get_model_id()}|{get_model_id('validate')}|{_PROMPT_VERSION}|{_canonicalize(url)}|{content}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
 
-def _extract_recursive(
-    url: str,
-    current_depth: int,
-    max_depth: int
-) -> dict:
+
+def _content_shingles(content: str) -> frozenset:
     """
-    Internal recursive function to extract and process recipe.
-    
-    Flow:
-    1. Extract content from URL
-    2. Validate + format in single LLM call
-    3. If valid recipe → return formatted JSON result
-    4. If invalid but has follow-up URL with confidence >= threshold:
-       → Recursively call with follow-up URL (if depth allows)
-    5. Otherwise → return failure with details
+    Fingerprint the main content of ``content`` as a set of hashed 3-word shingles.
     
-    Args:
-        url: URL to extract from
-        current_depth: Current recursion depth (0 = initial)
-        max_depth: Maximum allowed depth
-        
-    Returns:
-        dict representation of UnifiedRecipeResult
+    The fingerprinted window is the recipe-dense part picked by
+    ``_smart_truncate``, not the start of the page, so pages sharing a site
+    template (header, navigation) are not mistaken for one another.
     """
-    # STEP 1: Extract content
-    extraction_result = _extract_content(url)
+    main_content = _smart_truncate(content, NEAR_DUPLICATE_PREFIX_LENGTH)
+    words = _WORD_RE.findall(main_content.lower())
+    if len(words) < 3:
+        return frozenset(words)
+    return frozenset(hash(tuple(words[i:i + 3])) for i in range(len(words) - 2))
+
+
+def _failed_validation(reason: str) -> ValidateAndFormatOutput:
+    """Build the fallback validation result used when the LLM call fails."""
+    return ValidateAndFormatOutput(
+        is_valid_recipe=False,
+        recipe_data=None,
+        recipe_name=None,
+        has_ingredients=False,
+        has_instructions=False,
+        follow_up_url=None,
+        follow_up_confidence=0.0,
+        reason=reason,
+        confidence=0.0
+    )
+
+
+def _build_validate_messages(content: str, url: str, depth: int) -> list:
+    """Build the prompt messages for one validation/formatting call."""
+    # Truncate content to avoid token limits
+    truncated_content = _truncate_for_llm(content)
+    if len(truncated_content) < len(content):
+        logger.debug("Truncated content for LLM: %d -> %d chars", len(content), len(truncated_content))
+    
+    return _VALIDATE_PROMPT.format_messages(
+        content=truncated_content,
+        url=url,
+        depth=depth,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_structured_model():
+    """
+    Return the main model bound to ValidateAndFormatOutput.
     
-    if not extraction_result.success:
-        return UnifiedRecipeResult(
-            success=False,
-            recipe_json=None,
-            recipe_name=None,
-            extraction_url=url,
-            is_valid_recipe=False,
-            has_ingredients=False,
-            has_instructions=False,
-            follow_up_url=None,
-            extraction_depth=current_depth,
-            error=extraction_result.error,
-            confidence=0.0,
-            reason="Content extraction failed"
-        ).model_dump()
-    
-    # STEP 2: Validate + format in single LLM call
-    validate_format_result = _validate_and_format_combined(
-        content=extraction_result.content,
+    Built once per process: model initialization reads the environment,
+    creates HTTP clients and compiles the output schema.
+    """
+    return get_model(cached=True).with_structured_output(
+        ValidateAndFormatOutput, **structured_output_kwargs()
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_gate_model():
+    """Return the small validation model bound to RecipeClassification, built once."""
+    return get_model('validate', cached=True).with_structured_output(
+        RecipeClassification, **structured_output_kwargs()
+    )
+
+
+def _validation_gate_enabled() -> bool:
+    """
+    Whether a separate small model is configured to pre-screen pages.
+    
+    Off unless OPEN_ROUTER_MODEL_VALIDATE / GEMINI_MODEL_VALIDATE is set
+    explicitly (to a model other than the main one).
+    """
+    return task_model_configured('validate') and get_model_id('validate') != get_model_id()
+
+
+def _build_classify_messages(content: str, url: str) -> list:
+    """Build the prompt messages for one small-model classification call."""
+    return _CLASSIFY_PROMPT.format_messages(
+        content=_truncate_for_llm(content),
         url=url,
-        depth=current_depth
     )
+
+
+def _rejection_from_classification(output) -> Optional[ValidateAndFormatOutput]:
+    """
+    Turn a small-model verdict into a not-a-recipe result.
     
-    # STEP 3: Check if we have a valid recipe
-    if validate_format_result.is_valid_recipe and validate_format_result.recipe_data:
-        # SUCCESS! Convert recipe_data to RecipeJSON and add metadata
-        from .models import RecipeJSON
+    Only clear rejections are answered here: pages the classifier saw any
+    ingredients or instructions on still go to the main model, which
+    returns the partial_recipe_data that recipe generation falls back on.
+    
+    Returns:
+        ValidateAndFormatOutput when the page is clearly not a recipe, or
+        None when the main model should validate and format it
+    """
+    if isinstance(output, dict):
+        output = RecipeClassification(**output)
+    if output.is_recipe or output.has_ingredients or output.has_instructions:
+        return None
+    return ValidateAndFormatOutput(
+        is_valid_recipe=False,
+        recipe_data=None,
+        recipe_name=output.recipe_name,
+        has_ingredients=False,
+        has_instructions=False,
+        follow_up_url=output.follow_up_url,
+        follow_up_confidence=output.follow_up_confidence,
+        reason=f"{output.reason} (classified by validation model)",
+        confidence=0.8
+    )
+
+
+def _classify_recipe(content: str, url: str) -> Optional[ValidateAndFormatOutput]:
+    """
+    Screen a page with the small validation model.
+    
+    Returns:
+        A not-a-recipe result, or None when the page looks like a recipe or
+        the classification failed (the main model then decides)
+    """
+    try:
+        gate_model = _get_gate_model()
+        return _rejection_from_classification(gate_model.invoke(_build_classify_messages(content, url)))
+    except Exception:
+        return None
+
+
+def _apply_gate(
+    results: List[Optional[ValidateAndFormatOutput]],
+    pending: list,
+    outputs: list
+) -> list:
+    """Answer pending items the small model rejected; return the rest."""
+    still_pending = []
+    for entry, output in zip(pending, outputs):
+        index, cache_key, shingles, url, _ = entry
+        rejection = None
+        if not isinstance(output, Exception):
+            try:
+                rejection = _rejection_from_classification(output)
+            except Exception:
+                rejection = None
+        if rejection is None:
+            still_pending.append(entry)
+        else:
+            results[index] = _store_validation(cache_key, shingles, url, rejection)
+    return still_pending
+
+
+def _page_identity(url: str) -> str:
+    """Canonical host + path of ``url``."""
+    parsed = urlparse(_canonicalize(url))
+    return f"{parsed.netloc}{parsed.path.rstrip('/')}"
+
+
+def _normalized_words(text: str) -> str:
+    """Lowercase ``text`` and reduce it to single-space-separated words."""
+    return ' '.join(_WORD_RE.findall(text.lower()))
+
+
+def _get_cached_validation(
+    cache_key: str,
+    shingles: frozenset,
+    url: str,
+    content: str
+) -> Optional[ValidateAndFormatOutput]:
+    """
+    Return a cached result for identical content, or for a near-duplicate.
+    
+    A near-duplicate result is reused for a changed refetch of the same
+    page (canonical host + path), or for the same recipe syndicated to
+    another URL - but only when that recipe's name also appears in
+    ``content``. Pages that merely share a site template never share a
+    result.
+    """
+    cached = _validate_format_cache.get(cache_key)
+    if cached is None:
+        entry = _near_duplicate_index.get(shingles)
+        if entry is None:
+            return None
+        page, recipe_name, cached = entry
+        same_page = page == _page_identity(url)
+        if not same_page and not (
+            recipe_name and f" {recipe_name} " in f" {_normalized_words(content)} "
+        ):
+            return None
+    return ValidateAndFormatOutput.model_validate_json(cached)
+
+
+def _store_validation(cache_key: str, shingles: frozenset, url: str, result) -> ValidateAndFormatOutput:
+    """Coerce an LLM result to ValidateAndFormatOutput and cache it."""
+    # Ensure we return a ValidateAndFormatOutput instance
+    if isinstance(result, dict):
+        result = ValidateAndFormatOutput(**result)
+    
+    result_json = result.model_dump_json()
+    _validate_format_cache.set(cache_key, result_json)
+    # Only recipes carry a name to reuse them under on other URLs
+    recipe_name = _normalized_words(result.recipe_name or '') if result.is_valid_recipe else ''
+    _near_duplicate_index.add(shingles, (_page_identity(url), recipe_name, result_json))
+    return result
+
+
+def _validate_and_format_combined(
+    content: str,
+    url: str,
+    depth: int
+) -> ValidateAndFormatOutput:
+    """
+    Validate and format recipe content in a single LLM call.
+    
+    Uses structured output to get:
+    - Validation result (is_valid_recipe, has_ingredients, has_instructions)
+    - Structured JSON recipe data (if valid)
+    - Follow-up URL (if invalid and URLs present)
+    
+    Args:
+        content: Extracted text content
+        url: Source URL
+        depth: Current extraction depth
+        
+    Returns:
+        ValidateAndFormatOutput with validation + JSON formatting results
+        
+    When a separate small validation model is configured, it screens the
+    page first and the main model only runs on likely recipes.
+    
+    Successful results are cached for VALIDATE_FORMAT_CACHE_TTL seconds, so
+    retries and repeated submissions of the same page skip the LLM call.
+    A near-duplicate of a previously processed version of the same page
+    (rotating ads, timestamps, comment counts), or the same named recipe
+    republished at another URL, also reuses the result.
+    """
+    try:
+        cache_key = _validate_format_cache_key(content, url)
+        shingles = _content_shingles(content)
+        cached = _get_cached_validation(cache_key, shingles, url, content)
+        if cached is not None:
+            return cached
         
-        # Convert RecipeDataForLLM model to dict
-        recipe_data_dict = validate_format_result.recipe_data.model_dump()
-        # Add source URL to the recipe data
-        recipe_data_dict['source_url'] = url
+        if _validation_gate_enabled():
+            rejection = _classify_recipe(content, url)
+            if rejection is not None:
+                return _store_validation(cache_key, shingles, url, rejection)
         
-        # Create RecipeJSON instance (this will generate id and created_at)
-        recipe_json = RecipeJSON(**recipe_data_dict)
+        structured_model = _get_structured_model()
         
-        return UnifiedRecipeResult(
-            success=True,
-            recipe_json=recipe_json.model_dump(),
-            recipe_name=validate_format_result.recipe_name,
-            extraction_url=url,
-            is_valid_recipe=True,
-            has_ingredients=validate_format_result.has_ingredients,
-            has_instructions=validate_format_result.has_instructions,
-            follow_up_url=None,
-            extraction_depth=current_depth,
-            error=None,
-            confidence=validate_format_result.confidence,
-            reason=validate_format_result.reason
-        ).model_dump()
-    
-    # STEP 4: Recipe not found - check for follow-up URL
+        prompt_messages = _build_validate_messages(content, url, depth)
+        result = structured_model.invoke(prompt_messages)
+        return _store_validation(cache_key, shingles, url, result)
+        
+    except Exception as e:
+        # Fallback to failed validation
+        return _failed_validation(f"Validation/formatting failed: {str(e)}")
+
+
+def _prepare_validation_batch(
+    items: List[Tuple[str, str]],
+    depth: int
+) -> Tuple[List[Optional[ValidateAndFormatOutput]], list]:
+    """
+    Answer cached items and build prompts for the rest of a validation batch.
+    
+    Returns:
+        Tuple of (results with cached entries filled in, pending list of
+        (index, cache_key, shingles, url, messages) still needing the LLM)
+    """
+    results: List[Optional[ValidateAndFormatOutput]] = [None] * len(items)
+    pending = []
+    
+    for index, (content, url) in enumerate(items):
+        cache_key = _validate_format_cache_key(content, url)
+        shingles = _content_shingles(content)
+        cached = _get_cached_validation(cache_key, shingles, url, content)
+        if cached is not None:
+            results[index] = cached
+        else:
+            pending.append((index, cache_key, shingles, url, _build_validate_messages(content, url, depth)))
+    
+    return results, pending
+
+
+def _finish_validation_batch(
+    results: List[Optional[ValidateAndFormatOutput]],
+    pending: list,
+    outputs: list
+) -> List[ValidateAndFormatOutput]:
+    """Store LLM outputs for the pending items, turning exceptions into failed validations."""
+    for (index, cache_key, shingles, url, _), output in zip(pending, outputs):
+        if isinstance(output, Exception):
+            results[index] = _failed_validation(f"Validation/formatting failed: {str(output)}")
+            continue
+        try:
+            results[index] = _store_validation(cache_key, shingles, url, output)
+        except Exception as e:
+            results[index] = _failed_validation(f"Validation/formatting failed: {str(e)}")
+    
+    return results
+
+
+def _validate_and_format_batch(
+    items: List[Tuple[str, str]],
+    depth: int
+) -> List[ValidateAndFormatOutput]:
+    """
+    Validate and format several pages with one batched LLM dispatch.
+    
+    Cached pages are answered locally; the rest are sent together through
+    ``structured_model.batch`` so their round-trips overlap instead of
+    running one after another.
+    
+    Args:
+        items: List of (content, url) pairs
+        depth: Extraction depth shared by all items
+        
+    Returns:
+        List of ValidateAndFormatOutput, in the same order as ``items``
+    """
+    results, pending = _prepare_validation_batch(items, depth)
+    if pending and _validation_gate_enabled():
+        try:
+            gate_model = _get_gate_model()
+            gate_outputs = gate_model.batch(
+                [_build_classify_messages(*items[entry[0]]) for entry in pending],
+                config={"max_concurrency": LLM_BATCH_MAX_CONCURRENCY},
+                return_exceptions=True,
+            )
+        except Exception as e:
+            gate_outputs = [e] * len(pending)
+        pending = _apply_gate(results, pending, gate_outputs)
+    if not pending:
+        return results
+    
+    try:
+        structured_model = _get_structured_model()
+        outputs = structured_model.batch(
+            [messages for _, _, _, _, messages in pending],
+            config={"max_concurrency": LLM_BATCH_MAX_CONCURRENCY},
+            return_exceptions=True,
+        )
+    except Exception as e:
+        outputs = [e] * len(pending)
+    
+    return _finish_validation_batch(results, pending, outputs)
+
+
+async def _validate_and_format_batch_async(
+    items: List[Tuple[str, str]],
+    depth: int
+) -> List[ValidateAndFormatOutput]:
+    """
+    Async version of ``_validate_and_format_batch`` using ``structured_model.abatch``.
+    
+    Args:
+        items: List of (content, url) pairs
+        depth: Extraction depth shared by all items
+        
+    Returns:
+        List of ValidateAndFormatOutput, in the same order as ``items``
+    """
+    results, pending = _prepare_validation_batch(items, depth)
+    if pending and _validation_gate_enabled():
+        try:
+            gate_model = _get_gate_model()
+            gate_outputs = await gate_model.abatch(
+                [_build_classify_messages(*items[entry[0]]) for entry in pending],
+                config={"max_concurrency": LLM_BATCH_MAX_CONCURRENCY},
+                return_exceptions=True,
+            )
+        except Exception as e:
+            gate_outputs = [e] * len(pending)
+        pending = _apply_gate(results, pending, gate_outputs)
+    if not pending:
+        return results
+    
+    try:
+        structured_model = _get_structured_model()
+        outputs = await structured_model.abatch(
+            [messages for _, _, _, _, messages in pending],
+            config={"max_concurrency": LLM_BATCH_MAX_CONCURRENCY},
+            return_exceptions=True,
+        )
+    except Exception as e:
+        outputs = [e] * len(pending)
+    
+    return _finish_validation_batch(results, pending, outputs)
+
+
+async def _validate_and_format_combined_async(
+    content: str,
+    url: str,
+    depth: int
+) -> ValidateAndFormatOutput:
+    """
+    Async version of ``_validate_and_format_combined``.
+    
+    Awaits the LLM call instead of blocking, so the caller can prefetch
+    follow-up pages while the model is thinking. Shares the result caches
+    with the sync version.
+    """
+    results = await _validate_and_format_batch_async([(content, url)], depth)
+    return results[0]
+
+
+# =============================================================================
+# RECURSIVE EXTRACTION LOGIC
+# =============================================================================
+
+def _find_candidate_urls(content: str, source_url: str) -> List[str]:
+    """
+    Pick likely recipe links from extracted content, without an LLM call.
+    
+    Returns canonical HTTPS URLs in order of appearance, deduplicated,
+    excluding the source URL itself and social-media hosts (profiles and posts rarely
+    hold the full recipe).
+    """
+    source_url = _canonicalize(source_url)
+    candidates = []
+    for match in _URL_RE.finditer(content):
+        candidate = match.group(0).rstrip('.,;:!?')
+        if not candidate.startswith('https://'):
+            continue
+        candidate = _canonicalize(candidate)
+        if candidate == source_url or candidate in candidates:
+            continue
+        host = (urlparse(candidate).hostname or '').lower()
+        if any(host == social or host.endswith('.' + social) for social in _SOCIAL_HOSTS):
+            continue
+        candidates.append(candidate)
+    return candidates
+
+
+def _top_candidate(content: str, source_url: str) -> Optional[str]:
+    """
+    Pick the link most likely to be followed up, for speculative prefetching.
+    
+    Prefers the first generic web link whose URL mentions "recipe", falling
+    back to the first generic web link. Platform links are skipped: they are
+    not fetched through fetch_html.
+    """
+    candidates = [
+        candidate for candidate in _find_candidate_urls(content, source_url)
+        if not _PLATFORM_RE.search(candidate)
+    ]
+    for candidate in candidates:
+        if 'recipe' in candidate.lower():
+            return candidate
+    return candidates[0] if candidates else None
+
+
+def _recipe_link(content: str, source_url: str) -> Optional[str]:
+    """
+    Return the first link in ``content`` whose path names a recipe, if any.
+    
+    Stricter than _top_candidate: only the path counts (so a recipe site's
+    privacy or login page does not qualify) and there is no fallback to
+    arbitrary links, which on error and bio pages are mostly navigation.
+    """
+    for candidate in _find_candidate_urls(content, source_url):
+        if 'recipe' in urlparse(candidate).path.lower():
+            return candidate
+    return None
+
+
+def _is_borderline(content: str, url: str) -> bool:
+    """
+    Whether a page headed for the LLM is unlikely to hold the full recipe itself.
+    
+    Social posts usually only link to the recipe, and generic pages with
+    ingredient quantities but no steps (or steps but no quantities) are
+    often teasers for a linked page.
+    """
+    if _PLATFORM_RE.search(url):
+        return True
+    if not _STEP_RE.search(content):
+        return True
+    ingredient_markers = 0
+    for _ in _ING_RE.finditer(content):
+        ingredient_markers += 1
+        if ingredient_markers >= MIN_INGREDIENT_MARKERS:
+            return False
+    return True
+
+
+def _prefetch_html(url: str) -> None:
+    """Warm the HTML cache for ``url``, ignoring any error."""
+    try:
+        fetch_html(url)
+    except Exception:
+        pass
+
+
+def _json_ld_validation(recipe_data: RecipeDataForLLM) -> ValidateAndFormatOutput:
+    """Build a valid-recipe result from JSON-LD data, bypassing the LLM."""
+    return ValidateAndFormatOutput(
+        is_valid_recipe=True,
+        recipe_data=recipe_data,
+        recipe_name=recipe_data.title,
+        has_ingredients=True,
+        has_instructions=True,
+        follow_up_url=None,
+        follow_up_confidence=0.0,
+        reason="Complete schema.org Recipe found in page JSON-LD (no LLM call needed)",
+        confidence=1.0
+    )
+
+
+def _local_validation(
+    extraction_result: SimpleExtractionResult,
+    url: str
+) -> Optional[ValidateAndFormatOutput]:
+    """
+    Validate content locally when possible, returning None if the LLM is needed.
+    
+    Uses the page's JSON-LD Recipe when present, otherwise the cheap
+    not-a-recipe pre-filter.
+    """
+    if extraction_result.recipe_data is not None:
+        return _json_ld_validation(extraction_result.recipe_data)
+    return _prefilter_non_recipe(extraction_result.content, url)
+
+
+def _prefilter_non_recipe(content: str, url: str) -> Optional[ValidateAndFormatOutput]:
+    """
+    Reject generic web pages that cannot contain a recipe, without an LLM call.
+    
+    A page passes when it has at least MIN_INGREDIENT_MARKERS quantity+unit
+    matches (e.g. "2 cups", "200g"), any numbered step marker, or at least
+    MIN_COOKING_VERB_MARKERS cooking verbs ("preheat", "whisk", ...). Social
+    platform posts are never filtered: they are short, and the LLM can still
+    pull a recipe name from a caption or video title.
+    
+    Returns:
+        A not-a-recipe ValidateAndFormatOutput when the page is filtered,
+        otherwise None. Its follow-up URL is set only for a link whose path
+        names a recipe (see _recipe_link).
+    """
+    if _PLATFORM_RE.search(url):
+        return None
+    
+    ingredient_markers = 0
+    for _ in _ING_RE.finditer(content):
+        ingredient_markers += 1
+        if ingredient_markers >= MIN_INGREDIENT_MARKERS:
+            return None
+    if _STEP_RE.search(content):
+        return None
+    cooking_verbs = 0
+    for _ in _COOKING_VERB_RE.finditer(content):
+        cooking_verbs += 1
+        if cooking_verbs >= MIN_COOKING_VERB_MARKERS:
+            return None
+    
+    follow_up_url = _recipe_link(content, url)
+    return ValidateAndFormatOutput(
+        is_valid_recipe=False,
+        recipe_data=None,
+        recipe_name=None,
+        has_ingredients=False,
+        has_instructions=False,
+        follow_up_url=follow_up_url,
+        follow_up_confidence=FOLLOW_UP_CONFIDENCE_THRESHOLD if follow_up_url else 0.0,
+        reason="No ingredient quantities, instruction steps or cooking verbs found (skipped LLM validation)",
+        confidence=0.8
+    )
+
+
+def _speculative_batch_items(
+    extraction_result: SimpleExtractionResult,
+    url: str,
+    follow_up_url: str,
+    follow_up: SimpleExtractionResult
+) -> List[Tuple[str, str]]:
+    """
+    Build the validation batch for a page plus its speculatively fetched follow-up.
+    
+    The follow-up is only included when it still needs the LLM; its result
+    lands in the validation cache, so the follow-up step reuses it instead
+    of making a second serial call.
+    """
+    items = [(extraction_result.content, url)]
+    if follow_up.success and _local_validation(follow_up, follow_up_url) is None:
+        items.append((follow_up.content, follow_up_url))
+    return items
+
+
+def _extraction_failure_result(url: str, depth: int, error: Optional[str]) -> UnifiedRecipeResultDict:
+    """Build the result for a URL whose content could not be extracted."""
+    return {
+        'success': False,
+        'recipe_json': None,
+        'recipe_name': None,
+        'extraction_url': url,
+        'is_valid_recipe': False,
+        'has_ingredients': False,
+        'has_instructions': False,
+        'follow_up_url': None,
+        'extraction_depth': depth,
+        'error': error,
+        'confidence': 0.0,
+        'reason': "Content extraction failed",
+        'extracted_content': None,
+        'partial_recipe_data': None,
+    }
+
+
+def _validate_extractions(
+    urls: List[str],
+    extractions: List[SimpleExtractionResult]
+) -> Tuple[dict, List[int]]:
+    """
+    Validate follow-up extractions locally where possible.
+    
+    Returns:
+        Tuple of (validation results keyed by index, indices still needing the LLM)
+    """
+    validation_by_index = {}
+    ready = []
+    for index, extraction in enumerate(extractions):
+        if not extraction.success:
+            continue
+        local_result = _local_validation(extraction, urls[index])
+        if local_result is not None:
+            validation_by_index[index] = local_result
+        else:
+            ready.append(index)
+    return validation_by_index, ready
+
+
+def _extract_follow_ups(urls: List[str], depth: int, max_depth: int) -> List[dict]:
+    """
+    Extract and validate several follow-up URLs together.
+    
+    All URLs are fetched in parallel, then validated in a single batched LLM
+    dispatch. Results are processed in order and the list stops at the first
+    successful recipe.
+    
+    Args:
+        urls: Follow-up URLs, most promising first
+        depth: Extraction depth of the follow-up URLs
+        max_depth: Maximum allowed depth
+        
+    Returns:
+        List of dict results (UnifiedRecipeResult), one per processed URL
+    """
+    extractions = _extract_content_batch(urls)
+    
+    validation_by_index, ready = _validate_extractions(urls, extractions)
+    validations = _validate_and_format_batch(
+        [(extractions[index].content, urls[index]) for index in ready],
+        depth
+    )
+    validation_by_index.update(zip(ready, validations))
+    
+    results = []
+    for index, (follow_up_url, extraction) in enumerate(zip(urls, extractions)):
+        if extraction.success:
+            result = _process_validation(
+                follow_up_url, extraction, validation_by_index[index], depth, max_depth
+            )
+        else:
+            result = _extraction_failure_result(follow_up_url, depth, extraction.error)
+        results.append(result)
+        if result['success']:
+            break
+    return results
+
+
+def _success_result(
+    url: str,
+    validate_format_result: ValidateAndFormatOutput,
+    current_depth: int
+) -> UnifiedRecipeResultDict:
+    """Build the result for a page that holds a valid recipe."""
+    # Convert RecipeDataForLLM model to dict
+    recipe_data_dict = validate_format_result.recipe_data.model_dump()
+    # Add source URL to the recipe data
+    recipe_data_dict['source_url'] = url
+    
+    # Create RecipeJSON instance (this will generate id and created_at)
+    recipe_json = RecipeJSON(**recipe_data_dict)
+    
+    return {
+        'success': True,
+        'recipe_json': recipe_json.model_dump(),
+        'recipe_name': validate_format_result.recipe_name,
+        'extraction_url': url,
+        'is_valid_recipe': True,
+        'has_ingredients': validate_format_result.has_ingredients,
+        'has_instructions': validate_format_result.has_instructions,
+        'follow_up_url': None,
+        'extraction_depth': current_depth,
+        'error': None,
+        'confidence': validate_format_result.confidence,
+        'reason': validate_format_result.reason,
+        'extracted_content': None,
+        'partial_recipe_data': None,
+    }
+
+
+def _follow_up_candidates(
+    url: str,
+    extraction_result: SimpleExtractionResult,
+    validate_format_result: ValidateAndFormatOutput
+) -> Tuple[List[str], bool]:
+    """
+    Collect the LLM's follow-up URL plus links found locally in the content.
+    
+    Returns:
+        Tuple of (up to FOLLOW_UP_MAX_CANDIDATES URLs, whether the LLM
+        recommended the first one with enough confidence)
+    """
     has_follow_up = (
         validate_format_result.follow_up_url is not None and
         validate_format_result.follow_up_confidence >= FOLLOW_UP_CONFIDENCE_THRESHOLD
     )
-    
-    if has_follow_up and current_depth < max_depth:
-        # Recursively extract from follow-up URL
-        return _extract_recursive(
-            url=validate_format_result.follow_up_url,
-            current_depth=current_depth + 1,
-            max_depth=max_depth
-        )
-    
-    # STEP 5: No valid recipe and no viable follow-up options
+    follow_up_urls = [_canonicalize(validate_format_result.follow_up_url)] if has_follow_up else []
+    for candidate in _find_candidate_urls(extraction_result.content, url):
+        if candidate not in follow_up_urls:
+            follow_up_urls.append(candidate)
+    return follow_up_urls[:FOLLOW_UP_MAX_CANDIDATES], has_follow_up
+
+
+def _pick_follow_up_result(results: List[dict], has_follow_up: bool) -> Optional[dict]:
+    """Choose which follow-up result to report, or None to report the original page."""
+    if results[-1]['success']:
+        return results[-1]
+    if has_follow_up:
+        # Report on the link the LLM recommended
+        return results[0]
+    return None
+
+
+def _no_recipe_result(
+    url: str,
+    extraction_result: SimpleExtractionResult,
+    validate_format_result: ValidateAndFormatOutput,
+    current_depth: int,
+    max_depth: int
+) -> UnifiedRecipeResultDict:
+    """Build the result for a page with no valid recipe and no viable follow-up."""
     error_msg = "No valid recipe found"
     if current_depth >= max_depth and validate_format_result.follow_up_url:
         error_msg += f" and depth limit reached (max: {max_depth})"
@@ -833,28 +2262,366 @@ def _extract_recursive(
         if validate_format_result.partial_recipe_data:
             partial_recipe_data = validate_format_result.partial_recipe_data.model_dump()
     
-    return UnifiedRecipeResult(
-        success=False,
-        recipe_json=None,
+    return {
+        'success': False,
+        'recipe_json': None,
+        'recipe_name': validate_format_result.recipe_name,
+        'extraction_url': url,
+        'is_valid_recipe': False,
+        'has_ingredients': validate_format_result.has_ingredients,
+        'has_instructions': validate_format_result.has_instructions,
+        'follow_up_url': validate_format_result.follow_up_url,
+        'extraction_depth': current_depth,
+        'error': error_msg,
+        'confidence': validate_format_result.confidence,
+        'reason': validate_format_result.reason,
+        'extracted_content': extracted_content,
+        'partial_recipe_data': partial_recipe_data,
+    }
+
+
+def _report_progress(stage: str, url: str, **details) -> None:
+    """
+    Emit an intermediate progress event on LangGraph's custom stream.
+    
+    Lets the UI show what the tool is doing (page extracted, recipe found,
+    following links) before the final result is ready. A no-op when called
+    outside a graph run: get_stream_writer() raises RuntimeError without a
+    runnable context, and KeyError ('__pregel_runtime') when the tool is
+    invoked directly inside some other runnable.
+    """
+    try:
+        writer = get_stream_writer()
+    except (RuntimeError, KeyError):
+        return
+    writer({'tool': 'extract_and_process_recipe', 'stage': stage, 'url': url, **details})
+
+
+def _report_validation(url: str, validate_format_result: ValidateAndFormatOutput) -> None:
+    """Emit the 'validated' progress event for ``url``."""
+    _report_progress(
+        'validated',
+        url,
+        is_valid_recipe=validate_format_result.is_valid_recipe,
         recipe_name=validate_format_result.recipe_name,
-        extraction_url=url,
-        is_valid_recipe=False,
-        has_ingredients=validate_format_result.has_ingredients,
-        has_instructions=validate_format_result.has_instructions,
-        follow_up_url=validate_format_result.follow_up_url,
-        extraction_depth=current_depth,
-        error=error_msg,
-        confidence=validate_format_result.confidence,
-        reason=validate_format_result.reason,
-        extracted_content=extracted_content,
-        partial_recipe_data=partial_recipe_data
-    ).model_dump()
+    )
+
+
+def _process_validation(
+    url: str,
+    extraction_result: SimpleExtractionResult,
+    validate_format_result: ValidateAndFormatOutput,
+    current_depth: int,
+    max_depth: int
+) -> dict:
+    """
+    Turn a validation result into the final tool result, following links if needed.
+    
+    Args:
+        url: URL the content was extracted from
+        extraction_result: Extracted content for ``url``
+        validate_format_result: LLM validation/formatting result for the content
+        current_depth: Current recursion depth (0 = initial)
+        max_depth: Maximum allowed depth
+        
+    Returns:
+        dict representation of UnifiedRecipeResult
+    """
+    _report_validation(url, validate_format_result)
+    
+    # STEP 3: Check if we have a valid recipe
+    if validate_format_result.is_valid_recipe and validate_format_result.recipe_data:
+        return _success_result(url, validate_format_result, current_depth)
+    
+    # STEP 4: Recipe not found - try the LLM's follow-up URL plus links found locally
+    if current_depth < max_depth:
+        follow_up_urls, has_follow_up = _follow_up_candidates(
+            url, extraction_result, validate_format_result
+        )
+        if follow_up_urls:
+            _report_progress('following_up', url, follow_up_urls=follow_up_urls)
+            follow_up_results = _extract_follow_ups(follow_up_urls, current_depth + 1, max_depth)
+            result = _pick_follow_up_result(follow_up_results, has_follow_up)
+            if result is not None:
+                return result
+    
+    # STEP 5: No valid recipe and no viable follow-up options
+    return _no_recipe_result(
+        url, extraction_result, validate_format_result, current_depth, max_depth
+    )
+
+
+def _extract_recursive(
+    url: str,
+    current_depth: int,
+    max_depth: int
+) -> dict:
+    """
+    Internal recursive function to extract and process recipe.
+    
+    Flow:
+    1. Extract content from URL
+    2. Validate + format in single LLM call (skipped when the page embeds a
+       complete JSON-LD Recipe, or is a generic page with no ingredient
+       quantities or instruction steps). Borderline pages are batched with
+       their most likely follow-up page
+    3. If valid recipe → return formatted JSON result
+    4. If invalid and depth allows: collect the LLM's follow-up URL (if
+       confidence >= threshold) plus links found in the content, fetch up
+       to FOLLOW_UP_MAX_CANDIDATES of them in parallel and validate them in
+       one batched LLM call → return the first valid recipe
+    5. Otherwise → return failure with details
+    
+    Args:
+        url: URL to extract from
+        current_depth: Current recursion depth (0 = initial)
+        max_depth: Maximum allowed depth
+        
+    Returns:
+        dict representation of UnifiedRecipeResult
+    """
+    # STEP 1: Extract content
+    extraction_result = _extract_content(url)
+    
+    if not extraction_result.success:
+        return _extraction_failure_result(url, current_depth, extraction_result.error)
+    _report_progress('extracted', url, title=extraction_result.title, depth=current_depth)
+    
+    # STEP 2: Validate + format in single LLM call (unless JSON-LD or the
+    # pre-filter already settles it). The network is idle meanwhile, so the
+    # most likely follow-up page is prefetched into the HTML cache.
+    # When the page looks borderline, the follow-up is fetched first and both
+    # pages are validated in one batch (at most one speculative LLM call).
+    validate_format_result = _local_validation(extraction_result, url)
+    if validate_format_result is None:
+        prefetch_url = None
+        if current_depth < max_depth:
+            prefetch_url = _top_candidate(extraction_result.content, url)
+        if prefetch_url and _is_borderline(extraction_result.content, url):
+            follow_up = _extract_content(prefetch_url)
+            validate_format_result = _validate_and_format_batch(
+                _speculative_batch_items(extraction_result, url, prefetch_url, follow_up),
+                current_depth
+            )[0]
+        else:
+            if prefetch_url:
+                _PREFETCH_EXECUTOR.submit(_prefetch_html, prefetch_url)
+            validate_format_result = _validate_and_format_combined(
+                content=extraction_result.content,
+                url=url,
+                depth=current_depth
+            )
+    
+    return _process_validation(
+        url, extraction_result, validate_format_result, current_depth, max_depth
+    )
+
+
+# =============================================================================
+# ASYNC EXTRACTION PIPELINE
+# =============================================================================
+
+async def _extract_content_async(url: str) -> SimpleExtractionResult:
+    """
+    Async version of ``_extract_content``.
+    
+    Runs the blocking extractor (pooled HTTP session, yt-dlp, instaloader)
+    in a worker thread so the event loop stays free for other extractions
+    and LLM calls.
+    """
+    return await asyncio.to_thread(_extract_content, url)
+
+
+async def _extract_and_validate_async(
+    url: str,
+    depth: int,
+    extraction_task: Optional[asyncio.Task] = None
+) -> Tuple[SimpleExtractionResult, Optional[ValidateAndFormatOutput]]:
+    """
+    Extract one follow-up URL and validate it as soon as its content arrives.
+    
+    Returns:
+        Tuple of (extraction, validation), validation being None when the
+        extraction failed
+    """
+    extraction = await (extraction_task or _extract_content_async(url))
+    if not extraction.success:
+        return extraction, None
+    validation = _local_validation(extraction, url)
+    if validation is None:
+        validation = await _validate_and_format_combined_async(
+            content=extraction.content,
+            url=url,
+            depth=depth
+        )
+    return extraction, validation
+
+
+async def _extract_follow_ups_async(
+    urls: List[str],
+    depth: int,
+    max_depth: int,
+    prefetched: dict
+) -> List[dict]:
+    """
+    Async version of ``_extract_follow_ups``.
+    
+    Each URL runs its own extract-then-validate pipeline, so a page's LLM
+    call starts as soon as that page arrives rather than after the slowest
+    fetch. Results are still taken in priority order; once one is a valid
+    recipe the remaining pipelines are cancelled, skipping their LLM calls.
+    
+    Args:
+        urls: Follow-up URLs, most promising first
+        depth: Extraction depth of the follow-up URLs
+        max_depth: Maximum allowed depth
+        prefetched: Extraction tasks already started, keyed by URL; reused
+            instead of fetching the same page twice
+        
+    Returns:
+        List of dict results (UnifiedRecipeResult), one per processed URL
+    """
+    tasks = [
+        asyncio.create_task(_extract_and_validate_async(
+            follow_up_url, depth, prefetched.pop(follow_up_url, None)
+        ))
+        for follow_up_url in urls
+    ]
+    
+    results = []
+    try:
+        for follow_up_url, task in zip(urls, tasks):
+            extraction, validation = await task
+            if validation is None:
+                result = _extraction_failure_result(follow_up_url, depth, extraction.error)
+            else:
+                result = await _process_validation_async(
+                    follow_up_url, extraction, validation, depth, max_depth, {}
+                )
+            results.append(result)
+            if result['success']:
+                break
+    finally:
+        # Stop pipelines whose result is no longer needed
+        for task in tasks:
+            task.cancel()
+    return results
+
+
+async def _process_validation_async(
+    url: str,
+    extraction_result: SimpleExtractionResult,
+    validate_format_result: ValidateAndFormatOutput,
+    current_depth: int,
+    max_depth: int,
+    prefetched: dict
+) -> dict:
+    """Async version of ``_process_validation``; see it for the steps."""
+    _report_validation(url, validate_format_result)
+    if validate_format_result.is_valid_recipe and validate_format_result.recipe_data:
+        return _success_result(url, validate_format_result, current_depth)
+    
+    if current_depth < max_depth:
+        follow_up_urls, has_follow_up = _follow_up_candidates(
+            url, extraction_result, validate_format_result
+        )
+        if follow_up_urls:
+            _report_progress('following_up', url, follow_up_urls=follow_up_urls)
+            follow_up_results = await _extract_follow_ups_async(
+                follow_up_urls, current_depth + 1, max_depth, prefetched
+            )
+            result = _pick_follow_up_result(follow_up_results, has_follow_up)
+            if result is not None:
+                return result
+    
+    return _no_recipe_result(
+        url, extraction_result, validate_format_result, current_depth, max_depth
+    )
+
+
+async def _extract_recursive_async(
+    url: str,
+    current_depth: int,
+    max_depth: int
+) -> dict:
+    """
+    Async version of ``_extract_recursive``.
+    
+    Same flow, but while the LLM validates the page the top link found in
+    its content is fetched speculatively. If that link ends up among the
+    follow-up URLs its content is already on hand; otherwise the prefetch
+    is cancelled. Borderline pages wait for the prefetch and are validated
+    in one batch together with it.
+    
+    Args:
+        url: URL to extract from
+        current_depth: Current recursion depth (0 = initial)
+        max_depth: Maximum allowed depth
+        
+    Returns:
+        dict representation of UnifiedRecipeResult
+    """
+    extraction_result = await _extract_content_async(url)
+    
+    if not extraction_result.success:
+        return _extraction_failure_result(url, current_depth, extraction_result.error)
+    _report_progress('extracted', url, title=extraction_result.title, depth=current_depth)
+    
+    prefetched = {}
+    try:
+        validate_format_result = _local_validation(extraction_result, url)
+        if validate_format_result is None:
+            prefetch_url = None
+            if current_depth < max_depth:
+                prefetch_url = _top_candidate(extraction_result.content, url)
+            if prefetch_url:
+                prefetched[prefetch_url] = asyncio.create_task(
+                    _extract_content_async(prefetch_url)
+                )
+            if prefetch_url and _is_borderline(extraction_result.content, url):
+                follow_up = await prefetched[prefetch_url]
+                validate_format_result = (await _validate_and_format_batch_async(
+                    _speculative_batch_items(extraction_result, url, prefetch_url, follow_up),
+                    current_depth
+                ))[0]
+            else:
+                validate_format_result = await _validate_and_format_combined_async(
+                    content=extraction_result.content,
+                    url=url,
+                    depth=current_depth
+                )
+        
+        return await _process_validation_async(
+            url, extraction_result, validate_format_result, current_depth, max_depth, prefetched
+        )
+    finally:
+        # Drop speculative fetches that were never used
+        for task in prefetched.values():
+            task.cancel()
 
 
 # =============================================================================
 # PUBLIC TOOL INTERFACE
 # =============================================================================
 
+def clear_recipe_cache() -> None:
+    """Forget cached extract_and_process_recipe results (e.g. after a page changes)."""
+    _recipe_result_cache.clear()
+
+
+def _cached_recipe_result(url: str) -> Optional[dict]:
+    """Return a copy of the cached successful result for ``url``, if any."""
+    cached = _recipe_result_cache.get(url)
+    return copy.deepcopy(cached) if cached is not None else None
+
+
+def _cache_recipe_result(url: str, result: dict) -> dict:
+    """Cache ``result`` for ``url`` if it succeeded; failures are retried next time."""
+    if result['success']:
+        _recipe_result_cache.set(url, copy.deepcopy(result))
+    return result
+
+
 @tool
 def extract_and_process_recipe(url: str) -> dict:
     """
@@ -868,7 +2635,7 @@ def extract_and_process_recipe(url: str) -> dict:
     2. Validates if content contains a complete recipe (ingredients + instructions)
     3. Formats valid recipes into structured JSON
     4. Detects follow-up URLs if no recipe found
-    5. Automatically follows promising links (up to 1 additional URL)
+    5. Automatically follows promising links (one level deep, up to 3 candidates)
     
     **Advantages over separate tools:**
     - Single tool call instead of 3-4 separate calls
@@ -881,10 +2648,14 @@ def extract_and_process_recipe(url: str) -> dict:
     - You need to get a formatted recipe from any web source
     
     **Follow-up link behavior:**
-    - If no recipe is found but a promising URL is detected (confidence >= 0.6)
-    - Automatically extracts from that URL (max depth = 1)
+    - If no recipe is found, the detected follow-up URL (confidence >= 0.6)
+      and other links in the content are fetched in parallel (max 3)
+    - The first candidate that contains a valid recipe is returned (max depth = 1)
     - Prevents infinite loops with depth limiting
     
+    Successful results are cached per URL (tracking parameters and
+    fragments ignored) for 24 hours; call ``clear_recipe_cache()`` to reset.
+    
     Args:
         url: The URL to extract recipe from (HTTP/HTTPS)
         
@@ -928,8 +2699,32 @@ def extract_and_process_recipe(url: str) -> dict:
     # result['follow_up_url'] = "https://..." (if available)
     ```
     """
-    return _extract_recursive(
+    url = _canonicalize(url)
+    cached = _cached_recipe_result(url)
+    if cached is not None:
+        return cached
+    
+    return _cache_recipe_result(url, _extract_recursive(
         url=url,
         current_depth=0,
         max_depth=MAX_DEPTH_LIMIT
-    )
+    ))
+
+
+async def _aextract_and_process_recipe(url: str) -> dict:
+    """Async implementation of ``extract_and_process_recipe``."""
+    url = _canonicalize(url)
+    cached = _cached_recipe_result(url)
+    if cached is not None:
+        return cached
+    
+    return _cache_recipe_result(url, await _extract_recursive_async(
+        url=url,
+        current_depth=0,
+        max_depth=MAX_DEPTH_LIMIT
+    ))
+
+
+# Agents driven through ainvoke/astream await this instead of running the
+# sync tool in an executor thread.
+extract_and_process_recipe.coroutine = _aextract_and_process_recipe
@@ -1,12 +1,30 @@
 """Recipe validation and name extraction tools."""
 
+from functools import lru_cache
+
 from langchain_core.tools import tool
 from langchain_core.prompts import ChatPromptTemplate
 
 from .models import RecipeNameExtraction
-from utils.model import get_model
+from utils.model import get_model, structured_output_kwargs
 from utils.prompts import EXTRACT_RECIPE_NAME_PROMPT
 
+# Built once; the prompt text never changes between calls
+_EXTRACT_NAME_TEMPLATE = ChatPromptTemplate.from_messages([
+    (
+        "system",
+        EXTRACT_RECIPE_NAME_PROMPT,
+    )
+])
+
+
+@lru_cache(maxsize=1)
+def _get_name_model():
+    """Return the small name-extraction model bound to RecipeNameExtraction, built once."""
+    return get_model("name", cached=True).with_structured_output(
+        RecipeNameExtraction, **structured_output_kwargs()
+    )
+
 
 @tool
 def extract_recipe_name(text: str) -> dict:
@@ -41,20 +59,11 @@ def extract_recipe_name(text: str) -> dict:
     - Low confidence: cannot identify recipe name
     """
     try:
-        model = get_model()
-        
-        structured_model = model.with_structured_output(RecipeNameExtraction)
+        structured_model = _get_name_model()
         
-        prompt_template = ChatPromptTemplate.from_messages([
-            (
-                "system",
-                EXTRACT_RECIPE_NAME_PROMPT,
-            )
-        ])
-
-        prompt_messages = prompt_template.format_messages(text=text)
+        prompt_messages = _EXTRACT_NAME_TEMPLATE.format_messages(text=text)
         result = structured_model.invoke(prompt_messages)
-        return result.model_dump()
+        return result.model_dump(exclude_none=True)
         
     except Exception as e:
         # Fallback
@@ -63,4 +72,4 @@ def extract_recipe_name(text: str) -> dict:
             confidence="low",
             reason=f"Extraction failed: {str(e)}"
         )
-        return result.model_dump()
+        return result.model_dump(exclude_none=True)
@@ -1,5 +1,6 @@
 """Utility modules for the recipe extraction agent."""
 
-from .retry import with_retry
+from .retry import async_with_retry, with_retry
+from .cache import NearDuplicateIndex, TTLCache
 
-__all__ = ['with_retry']
+__all__ = ['with_retry', 'async_with_retry', 'TTLCache', 'NearDuplicateIndex']
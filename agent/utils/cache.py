@@ -0,0 +1,119 @@
+"""
+In-process caching utilities for agent tools.
+
+Provides a small thread-safe LRU cache with per-entry expiry, used to
+avoid repeating expensive network and LLM work for identical inputs.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after ``ttl`` seconds.
+
+    Args:
+        maxsize: Maximum number of entries kept (least recently used evicted first)
+        ttl: Default time-to-live in seconds for new entries
+
+    Example:
+        ```python
+        cache = TTLCache(maxsize=256, ttl=3600)
+        cache.set("key", "value")
+        cache.get("key")  # -> "value"
+        ```
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if missing/expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class NearDuplicateIndex:
+    """
+    Thread-safe similarity lookup over feature sets (e.g. word shingles).
+
+    Stores up to ``maxsize`` (features, value) pairs and returns the value
+    whose features have the highest Jaccard similarity to the query, provided
+    it reaches ``threshold``. Lookups are a linear scan, which is cheap for
+    the few hundred entries this is meant for.
+
+    Args:
+        maxsize: Maximum number of entries kept (oldest evicted first)
+        threshold: Minimum Jaccard similarity (0.0-1.0) for a match
+    """
+
+    def __init__(self, maxsize: int = 256, threshold: float = 0.9):
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._entries: "OrderedDict[frozenset, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, features: frozenset, default: Any = None) -> Any:
+        """Return the value of the most similar entry, or ``default``."""
+        if not features:
+            return default
+        best_score = self.threshold
+        best_key = None
+        with self._lock:
+            for key in self._entries:
+                shared = len(features & key)
+                score = shared / (len(features) + len(key) - shared)
+                if score >= best_score:
+                    best_score = score
+                    best_key = key
+            if best_key is None:
+                return default
+            self._entries.move_to_end(best_key)
+            return self._entries[best_key]
+
+    def add(self, features: frozenset, value: Any) -> None:
+        """Index ``value`` under ``features``, evicting the oldest entry if full."""
+        if not features:
+            return
+        with self._lock:
+            self._entries[features] = value
+            self._entries.move_to_end(features)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,50 @@
+"""
+Shared HTTP session for agent tools.
+
+Keep-alive connection pools avoid a new TCP + TLS handshake for every
+fetch (follow-up candidates often share a host). Transport errors are
+retried by @with_retry on the callers; the adapter only retries
+throttling/5xx responses.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from .retry import RETRIABLE_EXCEPTIONS
+
+# Transient errors to pass as ``retriable_exceptions`` when retrying calls
+# made with SESSION (requests' own types are not stdlib subclasses)
+RETRIABLE_HTTP_EXCEPTIONS = RETRIABLE_EXCEPTIONS + (
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+)
+
+
+def _build_adapter() -> HTTPAdapter:
+    # pool_connections is the number of per-host pools kept alive; pool_maxsize
+    # bounds concurrent sockets per host (prefetch + follow-up + batch fetches).
+    return HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        pool_block=False,
+        max_retries=Retry(
+            total=2,
+            connect=0,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        ),
+    )
+
+
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Encoding': ACCEPT_ENCODING,  # gzip/deflate, plus br/zstd when decodable
+})
+SESSION.mount('https://', _build_adapter())
+SESSION.mount('http://', _build_adapter())
@@ -1,26 +1,140 @@
 """Shared model initialization for agent tools."""
 
 import os
+from functools import lru_cache
+from typing import Optional
 
 from langchain.chat_models import init_chat_model
+from langchain_core.caches import InMemoryCache
 
+DEFAULT_GROQ_BASE_URL = "https://api.groq.com/openai/v1"
+# Small Groq model with json_schema structured-output support
+DEFAULT_GROQ_SMALL_MODEL = "openai/gpt-oss-20b"
+# Light tasks that may run on a smaller model, configured through
+# OPEN_ROUTER_MODEL_<TASK> / GEMINI_MODEL_<TASK>
+SMALL_MODEL_TASKS = ("validate", "name")
+# Values accepted by with_structured_output(method=...)
+STRUCTURED_OUTPUT_METHODS = ("json_schema", "function_calling", "json_mode")
+LLM_CACHE_MAXSIZE = 1024  # Responses kept by the shared tool-model LLM cache
 
-def get_model():
-    """Initialize the LLM model used by agent tools."""
-    openrouter_key = os.getenv("OPEN_ROUTER_API_KEY")
+
+@lru_cache(maxsize=1)
+def _llm_cache() -> InMemoryCache:
+    """
+    Return the response cache shared by models built with ``cached=True``.
+
+    Identical (prompt, model, params) calls - including structured-output
+    calls, which wrap the same chat model - are then answered from memory.
+    """
+    return InMemoryCache(maxsize=LLM_CACHE_MAXSIZE)
+
+
+def _openrouter_model_id(task: Optional[str]) -> str:
+    """Resolve the OpenRouter-compatible model name for ``task``."""
     openrouter_model = os.getenv("OPEN_ROUTER_MODEL", "openai/gpt-oss-120b")
-    openrouter_provider = os.getenv("OPEN_ROUTER_PROVIDER", "openai")
-    openrouter_base_url = os.getenv("OPEN_ROUTER_BASE_URL", "https://api.groq.com/openai/v1")
+    if task not in SMALL_MODEL_TASKS:
+        return openrouter_model
+    # The small default only exists on Groq; other endpoints must opt in.
+    base_url = os.getenv("OPEN_ROUTER_BASE_URL", DEFAULT_GROQ_BASE_URL)
+    default = DEFAULT_GROQ_SMALL_MODEL if base_url == DEFAULT_GROQ_BASE_URL else openrouter_model
+    return os.getenv(f"OPEN_ROUTER_MODEL_{task.upper()}", default)
+
+
+def _gemini_model_id(task: Optional[str]) -> str:
+    """Resolve the Gemini model name for ``task``."""
     gemini_model = os.getenv("GEMINI_MODEL", "google_genai:gemini-2.5-flash-lite")
+    if task not in SMALL_MODEL_TASKS:
+        return gemini_model
+    return os.getenv(f"GEMINI_MODEL_{task.upper()}", gemini_model)
+
+
+def task_model_configured(task: str) -> bool:
+    """
+    Whether a dedicated model for ``task`` was explicitly configured.
+
+    Checks OPEN_ROUTER_MODEL_<TASK> when OpenRouter is in use, otherwise
+    GEMINI_MODEL_<TASK>; built-in defaults do not count.
+    """
+    prefix = "OPEN_ROUTER_MODEL" if os.getenv("OPEN_ROUTER_API_KEY") else "GEMINI_MODEL"
+    return bool(os.getenv(f"{prefix}_{task.upper()}"))
+
+
+def get_model_id(task: Optional[str] = None) -> str:
+    """
+    Return an identifier for the model ``get_model(task)`` will initialize.
+
+    Args:
+        task: None for the main model, "validate" for the small model used
+            to gate recipe validation, or "name" for recipe name extraction
+    """
+    if os.getenv("OPEN_ROUTER_API_KEY"):
+        return _openrouter_model_id(task)
+    return _gemini_model_id(task)
+
+
+def structured_output_kwargs() -> dict:
+    """
+    Return the keyword arguments to pass to ``with_structured_output``.
+
+    STRUCTURED_OUTPUT_METHOD selects the provider mechanism (e.g.
+    "json_schema" for schema-constrained decoding, "function_calling");
+    unset keeps LangChain's default. On OpenAI-compatible endpoints
+    "json_schema" is sent in strict mode, so the provider compiles the
+    schema into its decoder and never returns output that fails validation.
+
+    Raises:
+        ValueError: If STRUCTURED_OUTPUT_METHOD is not one of
+            STRUCTURED_OUTPUT_METHODS
+    """
+    method = os.getenv("STRUCTURED_OUTPUT_METHOD", "").strip().lower()
+    if not method:
+        return {}
+    if method not in STRUCTURED_OUTPUT_METHODS:
+        raise ValueError(
+            f"Invalid STRUCTURED_OUTPUT_METHOD {method!r}; "
+            f"expected one of: {', '.join(STRUCTURED_OUTPUT_METHODS)}"
+        )
+    kwargs = {"method": method}
+    if method == "json_schema" and os.getenv("OPEN_ROUTER_API_KEY"):
+        kwargs["strict"] = True
+    return kwargs
+
+
+@lru_cache(maxsize=8)
+def get_model(task: Optional[str] = None, cached: bool = False):
+    """
+    Initialize the LLM model used by agent tools.
+
+    The model is built once per task and shared by all callers, so the
+    environment is read and the client constructed only on the first call
+    (use ``get_model.cache_clear()`` to pick up changed settings).
+
+    Args:
+        task: None for the main model, "validate" for the small, cheap
+            model used to classify pages before the main model formats them
+            (OPEN_ROUTER_MODEL_VALIDATE / GEMINI_MODEL_VALIDATE), or "name"
+            for the small model that extracts recipe names from user text
+            (OPEN_ROUTER_MODEL_NAME / GEMINI_MODEL_NAME)
+        cached: Answer repeated identical prompts from an in-memory cache.
+            Only for deterministic extraction/validation calls; the chat
+            and generation models must stay uncached so a regenerate or
+            repeated question gets a fresh answer.
+    """
+    cache_kwargs = {"cache": _llm_cache()} if cached else {}
+
+    openrouter_key = os.getenv("OPEN_ROUTER_API_KEY")
+    openrouter_provider = os.getenv("OPEN_ROUTER_PROVIDER", "openai")
+    openrouter_base_url = os.getenv("OPEN_ROUTER_BASE_URL", DEFAULT_GROQ_BASE_URL)
 
     if openrouter_key:
         print("✓ Using OpenRouter for LLM (Agent V5)")
         return init_chat_model(
-            model=openrouter_model,
+            model=_openrouter_model_id(task),
             model_provider=openrouter_provider,
             api_key=openrouter_key,
             base_url=openrouter_base_url,
+            **cache_kwargs,
         )
 
     print("✓ Using Google Gemini for LLM (Agent V5)")
-    return init_chat_model(gemini_model)
+    return init_chat_model(_gemini_model_id(task), **cache_kwargs)
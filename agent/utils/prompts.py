@@ -1,15 +1,31 @@
 """Prompt loading utilities."""
 
+import os
+import re
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict
 
 import opik
 
 _PROMPT_CACHE: Dict[str, str] = {}
 
+# Last prompt text fetched from Opik, so warm starts skip the network
+_PROMPT_DISK_CACHE_DIR = Path(
+    os.getenv('AURACHEF_PROMPT_CACHE_DIR', Path.home() / '.cache' / 'aurachef' / 'prompts')
+)
+_UNSAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9_.-]+')
 
-def _load_prompt(name: str) -> str:
-    opik_client = opik.Opik()
-    opik_prompt = opik_client.get_prompt(name=name)
+
+@lru_cache(maxsize=1)
+def _get_opik_client() -> opik.Opik:
+    return opik.Opik()
+
+
+def _fetch_prompt(name: str) -> str:
+    opik_prompt = _get_opik_client().get_prompt(name=name)
     if not opik_prompt:
         raise Exception(
             f"Prompt '{name}' not found in Opik. "
@@ -18,6 +34,59 @@ def _load_prompt(name: str) -> str:
     return opik_prompt.prompt
 
 
+def _disk_cache_path(name: str) -> Path:
+    return _PROMPT_DISK_CACHE_DIR / f"{_UNSAFE_FILENAME_RE.sub('_', name)}.txt"
+
+
+def _write_disk_cache(name: str, prompt: str) -> None:
+    """Atomically store ``prompt`` on disk; the cache is best-effort."""
+    path = _disk_cache_path(name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as tmp:
+            tmp.write(prompt)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Don't leave partial temp files behind (e.g. on a full disk)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _refresh_disk_cache(name: str) -> None:
+    """Re-fetch ``name`` from Opik for the next start; errors are ignored."""
+    try:
+        _write_disk_cache(name, _fetch_prompt(name))
+    except Exception:
+        pass
+
+
+def _load_prompt(name: str) -> str:
+    """
+    Return the prompt text, preferring the on-disk copy.
+
+    On a disk hit the prompt is refreshed from Opik in a background thread,
+    so edits made in the dashboard take effect on the next start. On a miss
+    it is fetched synchronously and written to disk.
+    """
+    try:
+        prompt = _disk_cache_path(name).read_text(encoding='utf-8')
+    except OSError:
+        prompt = None
+    if prompt:
+        threading.Thread(target=_refresh_disk_cache, args=(name,), daemon=True).start()
+        return prompt
+
+    prompt = _fetch_prompt(name)
+    _write_disk_cache(name, prompt)
+    return prompt
+
+
 def get_prompt(name: str) -> str:
     if name not in _PROMPT_CACHE:
         _PROMPT_CACHE[name] = _load_prompt(name)
@@ -1,34 +1,109 @@
 """
 Retry utilities for handling transient failures in tools.
 
-Provides decorators for automatic retry with exponential backoff on
-network-related errors like timeouts and connection failures.
+Provides decorators for automatic retry with jittered exponential backoff
+on network-related errors like timeouts and connection failures. Backoff
+waits can be cut short per call through ``retry_cancel_event``.
 """
 
+import asyncio
+import random
+import threading
 import time
 import logging
+from concurrent.futures import CancelledError
+from contextvars import ContextVar
 from functools import wraps
-from typing import Callable, Type, Tuple
-
-# Import common network exceptions
-try:
-    from requests.exceptions import Timeout, ConnectionError, RequestException
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
-    # Define placeholder types if requests not installed
-    Timeout = Exception
-    ConnectionError = Exception
-    RequestException = Exception
+from typing import Any, Callable, Optional, Type, Tuple
 
 logger = logging.getLogger(__name__)
 
-# Transient errors that should be retried
+# Transient errors that should be retried. Only stdlib types, so importing
+# this module stays cheap; HTTP client errors are registered by the caller
+# (see utils.http.RETRIABLE_HTTP_EXCEPTIONS).
 RETRIABLE_EXCEPTIONS: Tuple[Type[Exception], ...] = (
-    Timeout,
+    TimeoutError,
     ConnectionError,
 )
 
+# HTTP statuses worth retrying when an error carrying a response (e.g.
+# requests' HTTPError) is retriable; other 4xx responses will not change
+# on retry and fail immediately
+RETRIABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Event that aborts with_retry backoff waits in the current context, so each
+# caller cancels only its own retries (see call_with_cancel_event)
+retry_cancel_event: ContextVar[Optional[threading.Event]] = ContextVar(
+    'retry_cancel_event', default=None
+)
+
+
+def call_with_cancel_event(cancel_event: threading.Event, func: Callable, *args, **kwargs) -> Any:
+    """
+    Call ``func`` with ``cancel_event`` as the current retry_cancel_event.
+    
+    Setting the event then stops any @with_retry / @async_with_retry
+    function called inside ``func`` from sleeping out its next backoff. Meant to be submitted to
+    a worker thread, e.g. ``executor.submit(call_with_cancel_event, event, fetch, url)``.
+    """
+    token = retry_cancel_event.set(cancel_event)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        retry_cancel_event.reset(token)
+
+
+def _is_retriable(
+    error: Exception,
+    retriable_exceptions: Tuple[Type[Exception], ...]
+) -> bool:
+    """Whether ``error`` is a transient failure worth another attempt."""
+    if not isinstance(error, retriable_exceptions):
+        return False
+    status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status_code is not None:
+        return status_code in RETRIABLE_STATUS_CODES
+    return True
+
+
+def _retry_delay(
+    func: Callable,
+    error: Exception,
+    attempt: int,
+    max_attempts: int,
+    backoff_factor: float,
+    retriable_exceptions: Tuple[Type[Exception], ...]
+) -> Optional[float]:
+    """
+    Log a failed attempt and return the seconds to wait before the next one.
+    
+    Returns None when ``error`` should be re-raised instead (non-retriable,
+    or the last attempt). The backoff is jittered by +/-50% so callers that
+    failed together do not retry in lockstep.
+    """
+    if not _is_retriable(error, retriable_exceptions):
+        # Non-retriable exception, fail immediately
+        logger.error(
+            "%s failed with non-retriable error: %s", func.__name__, error
+        )
+        return None
+    
+    if attempt == max_attempts:
+        # Final attempt failed
+        logger.error(
+            "%s failed after %d attempts: %s", func.__name__, max_attempts, error
+        )
+        return None
+    
+    # Calculate jittered exponential backoff
+    wait_time = backoff_factor * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+    
+    logger.warning(
+        "%s attempt %d/%d failed: %s. Retrying in %.1fs...",
+        func.__name__, attempt, max_attempts, error, wait_time
+    )
+    return wait_time
+
 
 def with_retry(
     max_attempts: int = 3,
@@ -38,79 +113,120 @@ def with_retry(
     """
     Decorator to retry function calls on transient errors.
     
-    Implements exponential backoff: wait_time = backoff_factor * (2 ^ attempt)
+    Implements jittered exponential backoff:
+    wait_time = backoff_factor * 2^(attempt - 1) * uniform(0.5, 1.5)
     
     Args:
         max_attempts: Maximum number of retry attempts (default: 3)
         backoff_factor: Base multiplier for exponential backoff in seconds (default: 1.0)
-        retriable_exceptions: Tuple of exception types to retry on (default: Timeout, ConnectionError)
+        retriable_exceptions: Tuple of exception types to retry on (default: TimeoutError, ConnectionError)
         
     Returns:
         Decorated function with retry logic
         
     Example:
         ```python
-        @with_retry(max_attempts=3, backoff_factor=2.0)
+        from utils.http import RETRIABLE_HTTP_EXCEPTIONS, SESSION
+        
+        @with_retry(
+            max_attempts=3,
+            backoff_factor=2.0,
+            retriable_exceptions=RETRIABLE_HTTP_EXCEPTIONS,
+        )
         def fetch_data(url):
-            response = requests.get(url, timeout=10)
+            response = SESSION.get(url, timeout=10)
             return response.text
         
-        # Will retry up to 3 times with delays: 2s, 4s, 8s
+        # Will try up to 3 times, waiting about 2s, then 4s, between attempts
         result = fetch_data("https://example.com")
         ```
         
     Behavior:
         - Retries only on specified retriable exceptions
+        - Errors carrying an HTTP response are retried only for 429/5xx
         - Non-retriable exceptions fail immediately
         - Logs warnings on retry attempts
         - Logs errors on final failure
         - Re-raises the last exception if all attempts fail
+        - If the caller's retry_cancel_event is set during a backoff wait,
+          raises concurrent.futures.CancelledError instead of retrying
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            
             for attempt in range(1, max_attempts + 1):
                 try:
                     return func(*args, **kwargs)
-                    
-                except retriable_exceptions as e:
-                    last_exception = e
-                    
-                    if attempt == max_attempts:
-                        # Final attempt failed
-                        logger.error(
-                            f"{func.__name__} failed after {max_attempts} attempts: {e}"
-                        )
-                        raise
-                    
-                    # Calculate exponential backoff
-                    wait_time = backoff_factor * (2 ** (attempt - 1))
-                    
-                    logger.warning(
-                        f"{func.__name__} attempt {attempt}/{max_attempts} failed: {e}. "
-                        f"Retrying in {wait_time:.1f}s..."
+                except Exception as e:
+                    wait_time = _retry_delay(
+                        func, e, attempt, max_attempts, backoff_factor, retriable_exceptions
                     )
-                    
-                    time.sleep(wait_time)
-                    
+                    if wait_time is None:
+                        raise
+                    cancel_event = retry_cancel_event.get()
+                    if cancel_event is None:
+                        time.sleep(wait_time)
+                    elif cancel_event.wait(wait_time):
+                        raise CancelledError(f"{func.__name__} retry cancelled") from e
+                
+        return wrapper
+    return decorator
+
+
+def async_with_retry(
+    max_attempts: int = 3,
+    backoff_factor: float = 1.0,
+    retriable_exceptions: Tuple[Type[Exception], ...] = RETRIABLE_EXCEPTIONS
+):
+    """
+    Async version of ``with_retry`` for coroutine functions.
+    
+    Same retry rules and backoff, but waits with ``asyncio.sleep`` so the
+    event loop keeps serving other tasks between attempts. Cancelling the
+    task interrupts the wait as usual; a retry_cancel_event set for the
+    current context does too, raising concurrent.futures.CancelledError.
+    
+    Args:
+        max_attempts: Maximum number of retry attempts (default: 3)
+        backoff_factor: Base multiplier for exponential backoff in seconds (default: 1.0)
+        retriable_exceptions: Tuple of exception types to retry on (default: TimeoutError, ConnectionError)
+        
+    Returns:
+        Decorated coroutine function with retry logic
+        
+    Example:
+        ```python
+        @async_with_retry(max_attempts=3)
+        async def fetch_data(url):
+            return await asyncio.to_thread(fetch_html, url)
+        ```
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return await func(*args, **kwargs)
                 except Exception as e:
-                    # Non-retriable exception, fail immediately
-                    logger.error(
-                        f"{func.__name__} failed with non-retriable error: {e}"
+                    wait_time = _retry_delay(
+                        func, e, attempt, max_attempts, backoff_factor, retriable_exceptions
                     )
-                    raise
-            
-            # Should never reach here, but just in case
-            if last_exception:
-                raise last_exception
+                    if wait_time is None:
+                        raise
+                    cancel_event = retry_cancel_event.get()
+                    if cancel_event is None:
+                        await asyncio.sleep(wait_time)
+                    elif await asyncio.to_thread(cancel_event.wait, wait_time):
+                        raise CancelledError(f"{func.__name__} retry cancelled") from e
                 
         return wrapper
     return decorator
 
 
-def with_simple_retry(max_attempts: int = 2):
+def with_simple_retry(
+    max_attempts: int = 2,
+    retriable_exceptions: Tuple[Type[Exception], ...] = RETRIABLE_EXCEPTIONS
+):
     """
     Simplified retry decorator with no backoff, for quick retries.
     
@@ -119,19 +235,22 @@ def with_simple_retry(max_attempts: int = 2):
     
     Args:
         max_attempts: Maximum number of attempts (default: 2)
+        retriable_exceptions: Tuple of exception types to retry on (default: TimeoutError, ConnectionError)
         
     Returns:
         Decorated function with simple retry logic
         
     Example:
         ```python
-        @with_simple_retry(max_attempts=2)
+        from utils.http import RETRIABLE_HTTP_EXCEPTIONS, SESSION
+        
+        @with_simple_retry(max_attempts=2, retriable_exceptions=RETRIABLE_HTTP_EXCEPTIONS)
         def quick_check(url):
-            return requests.head(url, timeout=5)
+            return SESSION.head(url, timeout=5)
         ```
     """
     return with_retry(
         max_attempts=max_attempts,
         backoff_factor=0.5,  # Minimal delay
-        retriable_exceptions=RETRIABLE_EXCEPTIONS
+        retriable_exceptions=retriable_exceptions
     )